@@ -203,6 +203,59 @@ if BLENDER_AVAILABLE:
             default="Linkage_Mechanism"
         )
 
+    def create_linkage_mechanism(context, props):
+        """
+        Create a linkage mechanism from the given linkage properties.
+        
+        Shared by the create-mechanism operator and the studio presets so
+        callers can build mechanisms without an operator round-trip.
+        """
+        if not MODULES_LOADED:
+            return {'success': False, 'error': "Linkage animator modules not loaded properly"}
+        
+        # Create auto setup instance
+        auto_setup = BlenderAutoSetup()
+        
+        # Prepare linkage configuration
+        if props.linkage_type == 'four_bar':
+            linkage_config = {
+                'type': 'four_bar',
+                'ground_length': props.ground_length,
+                'input_length': props.input_length,
+                'coupler_length': props.coupler_length,
+                'output_length': props.output_length,
+                'name': props.linkage_name
+            }
+        elif props.linkage_type == 'slider_crank':
+            linkage_config = {
+                'type': 'slider_crank',
+                'crank_length': props.crank_length,
+                'connecting_rod_length': props.connecting_rod_length,
+                'name': props.linkage_name
+            }
+        else:
+            return {'success': False, 'error': f"Linkage type '{props.linkage_type}' not yet implemented"}
+        
+        # Create the linkage
+        result = auto_setup.create_linkage_armature(linkage_config)
+        
+        if not result['success']:
+            return {'success': False, 'error': f"Failed to create linkage: {result.get('error', 'Unknown error')}"}
+        
+        armature_obj = result['armature_object']
+        
+        # Select the created armature
+        context.view_layer.objects.active = armature_obj
+        armature_obj.select_set(True)
+        
+        # Switch to pose mode for animation
+        bpy.ops.object.mode_set(mode='POSE')
+        
+        # Store linkage info for animation
+        armature_obj['linkage_config'] = linkage_config
+        
+        return {'success': True, 'armature_object': armature_obj, 'linkage_config': linkage_config}
+
     # Main Operators
     class LINKAGE_OT_create_mechanism(Operator):
         """Create a new linkage mechanism with automatic setup."""
@@ -212,59 +265,15 @@ if BLENDER_AVAILABLE:
         bl_options = {'REGISTER', 'UNDO'}
         
         def execute(self, context):
-            if not MODULES_LOADED:
-                self.report({'ERROR'}, "Linkage animator modules not loaded properly")
-                return {'CANCELLED'}
-            
             try:
                 props = context.scene.linkage_properties
-                
-                # Create auto setup instance
-                auto_setup = BlenderAutoSetup()
-                
-                # Prepare linkage configuration
-                if props.linkage_type == 'four_bar':
-                    linkage_config = {
-                        'type': 'four_bar',
-                        'ground_length': props.ground_length,
-                        'input_length': props.input_length,
-                        'coupler_length': props.coupler_length,
-                        'output_length': props.output_length,
-                        'name': props.linkage_name
-                    }
-                elif props.linkage_type == 'slider_crank':
-                    linkage_config = {
-                        'type': 'slider_crank',
-                        'crank_length': props.crank_length,
-                        'connecting_rod_length': props.connecting_rod_length,
-                        'name': props.linkage_name
-                    }
-                else:
-                    self.report({'ERROR'}, f"Linkage type '{props.linkage_type}' not yet implemented")
-                    return {'CANCELLED'}
-                
-                # Create the linkage
-                result = auto_setup.create_linkage_armature(linkage_config)
+                result = create_linkage_mechanism(context, props)
                 
                 if result['success']:
-                    armature_obj = result['armature_object']
-                    
-                    # Select the created armature
-                    bpy.context.view_layer.objects.active = armature_obj
-                    armature_obj.select_set(True)
-                    
-                    # Switch to pose mode for animation
-                    bpy.context.view_layer.objects.active = armature_obj
-                    bpy.ops.object.mode_set(mode='POSE')
-                    
                     self.report({'INFO'}, f"Created {props.linkage_type} linkage: {props.linkage_name}")
-                    
-                    # Store linkage info for animation
-                    armature_obj['linkage_config'] = linkage_config
-                    
                     return {'FINISHED'}
                 else:
-                    self.report({'ERROR'}, f"Failed to create linkage: {result.get('error', 'Unknown error')}")
+                    self.report({'ERROR'}, result['error'])
                     return {'CANCELLED'}
                     
             except Exception as e:
@@ -599,11 +608,12 @@ class ROBOTANIM_PT_complete_workflow(Panel):
         scene = context.scene
         
         # Check if startup wizard is needed
-        if not hasattr(scene, 'robotanim_mode') or not scene.robotanim_mode:
+        robotanim_mode = scene.get('robotanim_mode', '')
+        if not robotanim_mode:
             self.draw_startup_interface(layout, context)
         else:
             # Show mode-specific interface
-            if scene.robotanim_mode == 'simple':
+            if robotanim_mode == 'simple':
                 self.draw_simple_workflow(layout, context)
             else:
                 self.draw_professional_workflow(layout, context)
@@ -830,7 +840,7 @@ class ROBOTANIM_PT_ai_assistant_panel(Panel):
     @classmethod
     def poll(cls, context):
         # Only show if in simple mode or professional mode with AI enabled
-        return getattr(context.scene, 'robotanim_mode', '') in ['simple', 'professional']
+        return context.scene.get('robotanim_mode', '') in ('simple', 'professional')
     
     def draw(self, context):
         layout = self.layout
@@ -10,15 +10,44 @@ Implements SolidWorks-like interface for creating geometric primitives:
 """
 
 import bpy
-import bmesh
-import mathutils
+from math import cos, sin, radians
 from mathutils import Vector, Matrix, Euler
 from bpy.types import Operator, Panel, PropertyGroup, Menu
 from bpy.props import StringProperty, FloatProperty, IntProperty, BoolProperty, EnumProperty, FloatVectorProperty
 import logging
+from array import array
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
+# Number of features shown in the panel's feature tree
+RECENT_FEATURES_SHOWN = 5
+
+# Offset of dimension labels above the dimensioned entity (never mutated)
+_DIM_LABEL_OFFSET = Vector((0.0, 0.0, 0.5))
+
+
+def _linear_dimension_value(entity1, entity2):
+    """Line length when dimensioning two lines; 0.0 for other pairs, 1.0 without a second entity."""
+    if not entity2:
+        return 1.0
+    if entity2['type'] == 'line':
+        return (entity1['end_point'] - entity1['start_point']).length
+    return 0.0
+
+
+# Dimension value calculators keyed by (dimension_type, entity1 type)
+_DIMENSION_VALUE = {
+    ('linear', 'line'): _linear_dimension_value,
+    ('linear', 'circle'): lambda e1, e2: 0.0 if e2 else 1.0,
+    ('radial', 'circle'): lambda e1, e2: e1['radius'],
+    ('diameter', 'circle'): lambda e1, e2: e1['radius'] * 2,
+}
+
+
+def _default_dimension_value(entity1, entity2):
+    return 1.0
+
 
 class SolidWorksCADManager:
     """
@@ -30,6 +59,7 @@ class SolidWorksCADManager:
         self.sketch_entities = []
         self.dimensions = []
         self.feature_tree = []
+        self.recent_features = deque(maxlen=RECENT_FEATURES_SHOWN)
         self.active_sketch = None
         
         # SolidWorks standard plane orientations
@@ -51,7 +81,7 @@ class SolidWorksCADManager:
         # Set plane orientation
         if name in self.standard_planes:
             rotation = self.standard_planes[name]['rotation']
-            plane_obj.rotation_euler = Euler([math.radians(r) for r in rotation], 'XYZ')
+            plane_obj.rotation_euler = Euler([radians(r) for r in rotation], 'XYZ')
         
         # Set up plane properties
         plane_obj['is_reference_plane'] = True
@@ -90,15 +120,22 @@ class SolidWorksCADManager:
         self.reference_planes[name] = plane_obj
         
         # Add to feature tree
-        self.feature_tree.append({
+        self._add_feature({
             'type': 'plane',
             'name': name,
             'object': plane_obj,
-            'children': []
+            'children': [],
+            '_label': f"📐 {name}",
+            '_icon': 'MESH_PLANE'
         })
         
         return plane_obj
     
+    def _add_feature(self, feature):
+        """Append a feature to the tree and the panel's recent-features view."""
+        self.feature_tree.append(feature)
+        self.recent_features.append(feature)
+    
     def start_sketch(self, plane_obj):
         """Start a new sketch on the specified plane."""
         if not plane_obj or not plane_obj.get('is_reference_plane'):
@@ -138,9 +175,10 @@ class SolidWorksCADManager:
         spline = curve_data.splines.new('POLY')
         spline.points.add(1)  # Add one more point (total 2)
         
-        # Set points
-        spline.points[0].co = (*start_point, 1)
-        spline.points[1].co = (*end_point, 1)
+        # Set points in one bulk call (x, y, z, w per point)
+        coords = array('f', (start_point[0], start_point[1], start_point[2], 1.0,
+                             end_point[0], end_point[1], end_point[2], 1.0))
+        spline.points.foreach_set("co", coords)
         
         # Create object
         line_obj = bpy.data.objects.new(f'Line_{len(self.sketch_entities)}', curve_data)
@@ -186,8 +224,8 @@ class SolidWorksCADManager:
         # Define circle points (approximation with 4 control points)
         angles = [0, 90, 180, 270]
         for i, angle in enumerate(angles):
-            x = center_point[0] + radius * math.cos(math.radians(angle))
-            y = center_point[1] + radius * math.sin(math.radians(angle))
+            x = center_point[0] + radius * cos(radians(angle))
+            y = center_point[1] + radius * sin(radians(angle))
             z = center_point[2]
             spline.points[i].co = (x, y, z, 1)
         
@@ -228,24 +266,13 @@ class SolidWorksCADManager:
         dimension_name = f"Dim_{len(self.dimensions) + 1}"
         
         # Calculate dimension value
-        if dimension_type == 'linear' and entity2:
-            if entity1['type'] == 'line' and entity2['type'] == 'line':
-                # Distance between parallel lines or length
-                value = (entity1['end_point'] - entity1['start_point']).length
-            else:
-                value = 0.0
-        elif dimension_type == 'radial' and entity1['type'] == 'circle':
-            value = entity1['radius']
-        elif dimension_type == 'diameter' and entity1['type'] == 'circle':
-            value = entity1['radius'] * 2
-        else:
-            value = 1.0
+        calculate = _DIMENSION_VALUE.get((dimension_type, entity1['type']), _default_dimension_value)
+        value = calculate(entity1, entity2)
         
         # Create dimension object (text object for display)
-        bpy.ops.object.text_add()
-        dim_obj = bpy.context.active_object
-        dim_obj.name = dimension_name
-        dim_obj.data.body = f"{value:.2f}"
+        text_data = bpy.data.curves.new(dimension_name, type='FONT')
+        text_data.body = f"{value:.2f}"
+        dim_obj = bpy.data.objects.new(dimension_name, text_data)
         
         # Position dimension
         if entity1['type'] == 'line':
@@ -255,7 +282,7 @@ class SolidWorksCADManager:
         else:
             midpoint = Vector((0, 0, 0))
         
-        dim_obj.location = midpoint + Vector((0, 0, 0.5))  # Offset above
+        dim_obj.location = midpoint + _DIM_LABEL_OFFSET
         
         # Set dimension properties
         dim_obj['is_dimension'] = True
@@ -270,9 +297,8 @@ class SolidWorksCADManager:
         dim_obj.data.align_x = 'CENTER'
         dim_obj.data.align_y = 'CENTER'
         
-        # Add to sketch collection
+        # Add to sketch collection (data-API objects start unlinked)
         self.active_sketch['collection'].objects.link(dim_obj)
-        bpy.context.scene.collection.objects.unlink(dim_obj)
         
         dimension = {
             'name': dimension_name,
@@ -294,12 +320,16 @@ class SolidWorksCADManager:
             return
         
         # Add sketch to feature tree
-        self.feature_tree.append({
+        sketch_name = self.active_sketch['name']
+        entity_count = len(self.active_sketch['entities'])
+        self._add_feature({
             'type': 'sketch',
-            'name': self.active_sketch['name'],
+            'name': sketch_name,
             'collection': self.active_sketch['collection'],
-            'entities': len(self.active_sketch['entities']),
-            'dimensions': len(self.active_sketch['dimensions'])
+            'entities': entity_count,
+            'dimensions': len(self.active_sketch['dimensions']),
+            '_label': f"✏️ {sketch_name} ({entity_count} entities)",
+            '_icon': 'GREASEPENCIL'
         })
         
         # Clear active sketch
@@ -323,10 +353,6 @@ class SolidWorksCADManager:
         return planes
 
 
-# Import math for calculations
-import math
-
-
 class ROBOTANIM_OT_create_reference_plane(Operator):
     """Create SolidWorks-style reference plane"""
     bl_idname = "robotanim.create_reference_plane"
@@ -527,11 +553,15 @@ class ROBOTANIM_OT_add_dimension(Operator):
             self.report({'ERROR'}, "No active sketch")
             return {'CANCELLED'}
         
-        # Get selected sketch entities
+        # Get selected sketch entities (a dimension needs at most two)
+        selected_objects = set(context.selected_objects)
         selected_entities = []
-        for entity in cad_manager.active_sketch['entities']:
-            if entity['object'].select_get():
-                selected_entities.append(entity)
+        if selected_objects:
+            for entity in cad_manager.active_sketch['entities']:
+                if entity['object'] in selected_objects:
+                    selected_entities.append(entity)
+                    if len(selected_entities) == 2:
+                        break
         
         if not selected_entities:
             self.report({'ERROR'}, "Please select sketch entities to dimension")
@@ -676,15 +706,10 @@ class ROBOTANIM_PT_solidworks_cad(Panel):
         tree_box = layout.box()
         tree_box.label(text="🌳 Feature Tree", icon='OUTLINER')
         
-        if cad_manager and cad_manager.feature_tree:
-            for i, feature in enumerate(cad_manager.feature_tree[-5:]):  # Show last 5
-                row = tree_box.row()
-                if feature['type'] == 'plane':
-                    row.label(text=f"📐 {feature['name']}", icon='MESH_PLANE')
-                elif feature['type'] == 'sketch':
-                    row.label(text=f"✏️ {feature['name']} ({feature['entities']} entities)", icon='GREASEPENCIL')
-                else:
-                    row.label(text=f"🔧 {feature['name']}")
+        if cad_manager and cad_manager.recent_features:
+            # Labels are formatted once when the feature is created
+            for feature in cad_manager.recent_features:
+                tree_box.row().label(text=feature['_label'], icon=feature['_icon'])
         else:
             tree_box.label(text="No features created yet")
         
@@ -8,11 +8,37 @@ on robot/mechanism animation workflow.
 
 import bpy
 from bpy.types import Panel, Operator, WorkSpaceKeyConfig
-from bpy.props import BoolProperty
+from bpy.props import BoolProperty, EnumProperty
 import bmesh
+from functools import lru_cache
 from .workspace_manager import WorkspaceManager, register_workspace_manager, unregister_workspace_manager
 
 
+# Panel labels, built once instead of on every redraw
+LABEL_STUDIO_MODE = "🎬 Animation Studio Mode"
+LABEL_QUICK_START = "🚀 Quick Start"
+LABEL_CREATE_MECHANISM = "🔧 Create New Mechanism"
+LABEL_ANIMATE_MECHANISM = "🎬 Animate Mechanism"
+LABEL_GALLERY = "📚 Mechanism Gallery"
+LABEL_ADJUST_SIZES = "📏 Adjust Sizes:"
+LABEL_GOOD_PROPORTIONS = "✅ Good proportions!"
+LABEL_BAD_PROPORTIONS = "⚠️ Adjust sizes for better motion"
+LABEL_ENGINE_DIMENSIONS = "📏 Engine Dimensions:"
+
+# (button text, preset_type) for the mechanism gallery
+PRESET_BUTTONS = (
+    ("⚙️ Four-Bar Linkage", 'four_bar_basic'),
+    ("🔄 Slider-Crank Engine", 'slider_crank_engine'),
+    ("🦾 Robot Arm Joint", 'robot_arm_joint'),
+)
+
+
+@lru_cache(maxsize=1)
+def _piston_stroke_label(crank_length):
+    """Format the piston stroke label, reusing it while the crank length is unchanged."""
+    return f"Piston Stroke: {crank_length * 2:.1f} units"
+
+
 class ROBOTANIM_OT_enter_studio_mode(Operator):
     """Enter Robot Animation Studio Mode - Simplified interface for beginners"""
     bl_idname = "robotanim.enter_studio_mode"
@@ -44,22 +70,26 @@ class ROBOTANIM_OT_enter_studio_mode(Operator):
     def setup_viewport_for_animation(self, context):
         """Configure viewport for optimal robot animation view."""
         # Set to solid shading mode
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                for space in area.spaces:
-                    if space.type == 'VIEW_3D':
-                        space.shading.type = 'SOLID'
-                        space.show_gizmo = True
-                        space.show_gizmo_object_translate = True
-                        space.show_gizmo_object_rotate = True
-                        space.show_gizmo_object_scale = False  # Hide scale gizmo
-                        space.overlay.show_grid = True
-                        space.overlay.show_axis_x = True
-                        space.overlay.show_axis_y = True
-                        space.overlay.show_axis_z = True
-                        
-                        # Set good camera angle for mechanisms
-                        space.region_3d.view_perspective = 'PERSP'
+        view_spaces = [space for area in context.screen.areas if area.type == 'VIEW_3D'
+                       for space in area.spaces if space.type == 'VIEW_3D']
+        for space in view_spaces:
+            shading = space.shading
+            overlay = space.overlay
+            
+            shading.type = 'SOLID'
+            space.show_gizmo = True
+            space.show_gizmo_object_translate = True
+            space.show_gizmo_object_rotate = True
+            space.show_gizmo_object_scale = False  # Hide scale gizmo
+            overlay.show_grid = True
+            overlay.show_axis_x = True
+            overlay.show_axis_y = True
+            overlay.show_axis_z = True
+            
+            # Set good camera angle for mechanisms
+            region_3d = space.region_3d
+            if region_3d.view_perspective != 'PERSP':
+                region_3d.view_perspective = 'PERSP'
     
     def hide_complex_ui(self, context):
         """Hide complex Blender UI elements for beginners."""
@@ -121,45 +151,43 @@ class ROBOTANIM_PT_studio_main(Panel):
         # Header with mode indicator
         header = layout.box()
         row = header.row()
-        row.label(text="🎬 Animation Studio Mode", icon='ARMATURE_DATA')
+        row.label(text=LABEL_STUDIO_MODE, icon='ARMATURE_DATA')
         row.operator("robotanim.exit_studio_mode", text="", icon='X')
         
         layout.separator()
         
         # Quick start section
         quick_box = layout.box()
-        quick_box.label(text="🚀 Quick Start", icon='ZOOMIN')
+        quick_box.label(text=LABEL_QUICK_START, icon='ZOOMIN')
         
         col = quick_box.column(align=True)
         col.scale_y = 1.5
         
         # Large, clear buttons for main actions
         col.operator("linkage.create_mechanism", 
-                    text="🔧 Create New Mechanism", 
+                    text=LABEL_CREATE_MECHANISM, 
                     icon='ADD')
         
-        # Only show animation button if armature is selected
-        if (context.active_object and 
-            context.active_object.type == 'ARMATURE' and 
-            'linkage_config' in context.active_object):
+        # Only show animation button if a linkage armature is selected
+        active_obj = context.active_object
+        is_rigged = (active_obj is not None and
+                     active_obj.type == 'ARMATURE' and
+                     'linkage_config' in active_obj)
+        if is_rigged:
             col.operator("linkage.animate_mechanism", 
-                        text="🎬 Animate Mechanism", 
+                        text=LABEL_ANIMATE_MECHANISM, 
                         icon='PLAY')
         
         layout.separator()
         
         # Mechanism gallery
         gallery_box = layout.box()
-        gallery_box.label(text="📚 Mechanism Gallery", icon='PRESET')
+        gallery_box.label(text=LABEL_GALLERY, icon='PRESET')
         
         # Quick preset buttons
         preset_col = gallery_box.column(align=True)
-        preset_col.operator("robotanim.create_preset", 
-                           text="⚙️ Four-Bar Linkage").preset_type = 'four_bar_basic'
-        preset_col.operator("robotanim.create_preset", 
-                           text="🔄 Slider-Crank Engine").preset_type = 'slider_crank_engine'
-        preset_col.operator("robotanim.create_preset", 
-                           text="🦾 Robot Arm Joint").preset_type = 'robot_arm_joint'
+        for text, preset_type in PRESET_BUTTONS:
+            preset_col.operator("robotanim.create_preset", text=text).preset_type = preset_type
 
 
 class ROBOTANIM_PT_studio_build(Panel):
@@ -178,6 +206,7 @@ class ROBOTANIM_PT_studio_build(Panel):
     def draw(self, context):
         layout = self.layout
         props = context.scene.linkage_properties
+        linkage_type = props.linkage_type
         
         # Mechanism type with big icons
         layout.label(text="Choose Your Mechanism:")
@@ -188,7 +217,7 @@ class ROBOTANIM_PT_studio_build(Panel):
         # Four-bar linkage
         fourbar_box = grid.box()
         fourbar_box.scale_y = 1.2
-        if props.linkage_type == 'four_bar':
+        if linkage_type == 'four_bar':
             fourbar_box.alert = True
         fourbar_col = fourbar_box.column(align=True)
         fourbar_col.operator("robotanim.select_mechanism", 
@@ -199,7 +228,7 @@ class ROBOTANIM_PT_studio_build(Panel):
         # Slider-crank
         slider_box = grid.box()
         slider_box.scale_y = 1.2
-        if props.linkage_type == 'slider_crank':
+        if linkage_type == 'slider_crank':
             slider_box.alert = True
         slider_col = slider_box.column(align=True)
         slider_col.operator("robotanim.select_mechanism", 
@@ -210,9 +239,9 @@ class ROBOTANIM_PT_studio_build(Panel):
         layout.separator()
         
         # Simple parameter controls
-        if props.linkage_type == 'four_bar':
+        if linkage_type == 'four_bar':
             self.draw_fourbar_simple_params(layout, props)
-        elif props.linkage_type == 'slider_crank':
+        elif linkage_type == 'slider_crank':
             self.draw_slider_simple_params(layout, props)
         
         layout.separator()
@@ -226,7 +255,7 @@ class ROBOTANIM_PT_studio_build(Panel):
     
     def draw_fourbar_simple_params(self, layout, props):
         """Simplified four-bar parameters with visual aids."""
-        layout.label(text="📏 Adjust Sizes:", icon='RULER')
+        layout.label(text=LABEL_ADJUST_SIZES, icon='RULER')
         
         # Use sliders instead of number inputs for easier interaction
         layout.prop(props, "ground_length", text="Base Length", slider=True)
@@ -236,20 +265,19 @@ class ROBOTANIM_PT_studio_build(Panel):
         
         # Visual feedback
         if (props.input_length + props.coupler_length) <= props.ground_length + props.output_length:
-            layout.label(text="✅ Good proportions!", icon='CHECKMARK')
+            layout.label(text=LABEL_GOOD_PROPORTIONS, icon='CHECKMARK')
         else:
-            layout.label(text="⚠️ Adjust sizes for better motion", icon='ERROR')
+            layout.label(text=LABEL_BAD_PROPORTIONS, icon='ERROR')
     
     def draw_slider_simple_params(self, layout, props):
         """Simplified slider-crank parameters."""
-        layout.label(text="📏 Engine Dimensions:", icon='RULER')
+        layout.label(text=LABEL_ENGINE_DIMENSIONS, icon='RULER')
         
         layout.prop(props, "crank_length", text="Crank Radius", slider=True)
         layout.prop(props, "connecting_rod_length", text="Rod Length", slider=True)
         
         # Calculate stroke for user info
-        stroke = props.crank_length * 2
-        layout.label(text=f"Piston Stroke: {stroke:.1f} units")
+        layout.label(text=_piston_stroke_label(props.crank_length))
 
 
 class ROBOTANIM_PT_studio_animate(Panel):
@@ -263,9 +291,10 @@ class ROBOTANIM_PT_studio_animate(Panel):
     
     @classmethod
     def poll(cls, context):
+        active_obj = context.active_object
         return (getattr(context.scene, 'robotanim_studio_mode', False) and
-                context.active_object and 
-                context.active_object.type == 'ARMATURE')
+                active_obj is not None and
+                active_obj.type == 'ARMATURE')
     
     def draw(self, context):
         layout = self.layout
@@ -310,51 +339,87 @@ class ROBOTANIM_OT_select_mechanism(Operator):
     bl_label = "Select Mechanism"
     bl_options = {'REGISTER', 'UNDO'}
     
-    mech_type: bpy.props.StringProperty()
+    mech_type: EnumProperty(
+        name="Mechanism Type",
+        items=[
+            ('four_bar', "Four-Bar Linkage", "Classic four-bar linkage mechanism"),
+            ('slider_crank', "Slider-Crank", "Slider-crank mechanism"),
+        ],
+        default='four_bar'
+    )
     
     def execute(self, context):
         context.scene.linkage_properties.linkage_type = self.mech_type
         return {'FINISHED'}
 
 
+def _apply_four_bar_basic(props):
+    """Classic four-bar proportions."""
+    props.linkage_type = 'four_bar'
+    props.ground_length = 10.0
+    props.input_length = 3.0
+    props.coupler_length = 8.0
+    props.output_length = 5.0
+    props.linkage_name = "Classic_FourBar"
+
+
+def _apply_slider_crank_engine(props):
+    """Engine-like proportions."""
+    props.linkage_type = 'slider_crank'
+    props.crank_length = 2.0
+    props.connecting_rod_length = 6.0
+    props.linkage_name = "Engine_Piston"
+
+
+def _apply_robot_arm_joint(props):
+    """Robot arm joint."""
+    props.linkage_type = 'four_bar'
+    props.ground_length = 8.0
+    props.input_length = 4.0
+    props.coupler_length = 6.0
+    props.output_length = 3.0
+    props.linkage_name = "Robot_Joint"
+
+
+# Preset id -> function applying its parameters to linkage properties
+_PRESETS = {
+    'four_bar_basic': _apply_four_bar_basic,
+    'slider_crank_engine': _apply_slider_crank_engine,
+    'robot_arm_joint': _apply_robot_arm_joint,
+}
+
+
 class ROBOTANIM_OT_create_preset(Operator):
     """Create preset mechanisms for beginners"""
     bl_idname = "robotanim.create_preset"
     bl_label = "Create Preset"
     bl_options = {'REGISTER', 'UNDO'}
     
-    preset_type: bpy.props.StringProperty()
+    preset_type: EnumProperty(
+        name="Preset",
+        items=[
+            ('four_bar_basic', "Four-Bar Linkage", "Classic four-bar proportions"),
+            ('slider_crank_engine', "Slider-Crank Engine", "Engine-like proportions"),
+            ('robot_arm_joint', "Robot Arm Joint", "Four-bar robot arm joint"),
+        ],
+        default='four_bar_basic'
+    )
     
     def execute(self, context):
         props = context.scene.linkage_properties
+        _PRESETS[self.preset_type](props)
         
-        if self.preset_type == 'four_bar_basic':
-            # Classic four-bar proportions
-            props.linkage_type = 'four_bar'
-            props.ground_length = 10.0
-            props.input_length = 3.0
-            props.coupler_length = 8.0
-            props.output_length = 5.0
-            props.linkage_name = "Classic_FourBar"
-            
-        elif self.preset_type == 'slider_crank_engine':
-            # Engine-like proportions
-            props.linkage_type = 'slider_crank'
-            props.crank_length = 2.0
-            props.connecting_rod_length = 6.0
-            props.linkage_name = "Engine_Piston"
-            
-        elif self.preset_type == 'robot_arm_joint':
-            # Robot arm joint
-            props.linkage_type = 'four_bar'
-            props.ground_length = 8.0
-            props.input_length = 4.0
-            props.coupler_length = 6.0
-            props.output_length = 3.0
-            props.linkage_name = "Robot_Joint"
-        
-        # Auto-create the mechanism
-        bpy.ops.linkage.create_mechanism()
+        # Auto-create the mechanism directly, without an operator round-trip
+        from .. import create_linkage_mechanism
+        try:
+            result = create_linkage_mechanism(context, props)
+        except Exception as e:
+            self.report({'ERROR'}, f"Error creating linkage: {str(e)}")
+            return {'CANCELLED'}
+        
+        if not result['success']:
+            self.report({'ERROR'}, result['error'])
+            return {'CANCELLED'}
         
         self.report({'INFO'}, f"Created {self.preset_type.replace('_', ' ').title()}!")
         return {'FINISHED'}
@@ -376,7 +441,7 @@ def unregister_studio_properties():
 
 
 # Classes to register
-studio_classes = [
+studio_classes = (
     ROBOTANIM_OT_enter_studio_mode,
     ROBOTANIM_OT_exit_studio_mode,
     ROBOTANIM_OT_select_mechanism,
@@ -384,13 +449,15 @@ studio_classes = [
     ROBOTANIM_PT_studio_main,
     ROBOTANIM_PT_studio_build,
     ROBOTANIM_PT_studio_animate,
-]
+)
+
+
+_register_studio_classes, _unregister_studio_classes = bpy.utils.register_classes_factory(studio_classes)
 
 
 def register_studio_ui():
     """Register studio UI classes."""
-    for cls in studio_classes:
-        bpy.utils.register_class(cls)
+    _register_studio_classes()
     register_studio_properties()
     register_workspace_manager()
 
@@ -399,5 +466,4 @@ def unregister_studio_ui():
     """Unregister studio UI classes."""
     unregister_workspace_manager()
     unregister_studio_properties()
-    for cls in reversed(studio_classes):
-        bpy.utils.unregister_class(cls) 
\ No newline at end of file
+    _unregister_studio_classes()
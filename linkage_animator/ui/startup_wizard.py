@@ -9,9 +9,67 @@ and guided onboarding for both professional and simple users.
 import bpy
 from bpy.types import Panel, Operator, PropertyGroup
 from bpy.props import StringProperty, BoolProperty, EnumProperty, IntProperty
-import webbrowser
-import os
-import time
+import queue
+import threading
+from contextlib import contextmanager
+
+
+# Wizard labels, built once instead of on every redraw
+LABEL_WIZARD_TITLE = "🤖 Robot Animation Studio"
+LABEL_CHOOSE_EXPERIENCE = "🎯 Choose Your Experience:"
+LABEL_CATALOGUE = "🤖 Robot Catalogue"
+LABEL_CATALOGUE_CONNECTED = "✅ Connected to robot library"
+LABEL_CATALOGUE_CONNECT = "🔗 Connect to download robot models"
+LABEL_READY_TO_ANIMATE = "🎯 Ready to animate robots?"
+LABEL_START_WIZARD = "🚀 Start Setup Wizard"
+
+CATALOGUE_URL = "https://robot-catalogue.com/models"  # Placeholder URL
+
+# (mode id, button text, icon, description bullets) for the mode selector
+MODES = (
+    ('simple', "🎨 Simple Mode", 'RESTRICT_SELECT_OFF', (
+        "✨ Drag-and-drop robot animation",
+        "✨ No Blender knowledge required",
+        "✨ Guided workflow with AI assistance",
+        "✨ Perfect for beginners and educators",
+    )),
+    ('professional', "🔧 Professional Mode", 'TOOL_SETTINGS', (
+        "⚡ Full Blender power + robot tools",
+        "⚡ Advanced simulation features",
+        "⚡ Custom scripting and automation",
+        "⚡ Professional workflow optimization",
+    )),
+)
+
+# Text progress bars indexed by filled tenths (0-10)
+_PROGRESS_BARS = tuple("█" * filled + "░" * (10 - filled) for filled in range(11))
+
+def _redraw_wizard_area(context):
+    """Tag only the area hosting the wizard for redraw after a progress change."""
+    area = context.area
+    if area is not None:
+        area.tag_redraw()
+
+
+# Nesting depth of active wizard update batches
+_update_batch_depth = [0]
+
+
+@contextmanager
+def _wizard_update(context):
+    """
+    Batch writes to the wizard properties.
+    
+    Yields the wizard property group and tags a single redraw when the
+    outermost batch exits, however many properties were written.
+    """
+    _update_batch_depth[0] += 1
+    try:
+        yield context.scene.startup_wizard
+    finally:
+        _update_batch_depth[0] -= 1
+        if _update_batch_depth[0] == 0:
+            _redraw_wizard_area(context)
 
 
 class StartupWizardProperties(PropertyGroup):
@@ -79,7 +137,7 @@ class ROBOTANIM_OT_startup_wizard(Operator):
         header.scale_y = 1.5
         row = header.row()
         row.alignment = 'CENTER'
-        row.label(text="🤖 Robot Animation Studio", icon='ARMATURE_DATA')
+        row.label(text=LABEL_WIZARD_TITLE, icon='ARMATURE_DATA')
         
         # Progress bar
         progress_box = layout.box()
@@ -88,11 +146,7 @@ class ROBOTANIM_OT_startup_wizard(Operator):
         # Visual progress bar
         progress_row = progress_box.row()
         progress_row.scale_y = 0.5
-        for i in range(10):
-            if i < (props.setup_progress // 10):
-                progress_row.label(text="█", icon='NONE')
-            else:
-                progress_row.label(text="░", icon='NONE')
+        progress_row.label(text=_PROGRESS_BARS[props.setup_progress // 10])
         
         progress_box.label(text=f"Current Step: {props.current_step}")
         
@@ -100,55 +154,34 @@ class ROBOTANIM_OT_startup_wizard(Operator):
         
         # Mode selection
         mode_box = layout.box()
-        mode_box.label(text="🎯 Choose Your Experience:", icon='SETTINGS')
+        mode_box.label(text=LABEL_CHOOSE_EXPERIENCE, icon='SETTINGS')
         
-        # Simple Mode
-        simple_box = mode_box.box()
-        if props.selected_mode == 'simple':
-            simple_box.alert = True
-        simple_row = simple_box.row()
-        simple_row.scale_y = 1.5
-        simple_op = simple_row.operator("robotanim.select_mode", 
-                                       text="🎨 Simple Mode", 
-                                       icon='RESTRICT_SELECT_OFF')
-        simple_op.mode = 'simple'
-        
-        simple_desc = simple_box.column()
-        simple_desc.label(text="✨ Drag-and-drop robot animation")
-        simple_desc.label(text="✨ No Blender knowledge required")
-        simple_desc.label(text="✨ Guided workflow with AI assistance")
-        simple_desc.label(text="✨ Perfect for beginners and educators")
-        
-        # Professional Mode
-        prof_box = mode_box.box()
-        if props.selected_mode == 'professional':
-            prof_box.alert = True
-        prof_row = prof_box.row()
-        prof_row.scale_y = 1.5
-        prof_op = prof_row.operator("robotanim.select_mode", 
-                                   text="🔧 Professional Mode", 
-                                   icon='TOOL_SETTINGS')
-        prof_op.mode = 'professional'
-        
-        prof_desc = prof_box.column()
-        prof_desc.label(text="⚡ Full Blender power + robot tools")
-        prof_desc.label(text="⚡ Advanced simulation features")
-        prof_desc.label(text="⚡ Custom scripting and automation")
-        prof_desc.label(text="⚡ Professional workflow optimization")
+        selected_mode = props.selected_mode
+        for mode_id, title, icon, bullets in MODES:
+            box = mode_box.box()
+            if selected_mode == mode_id:
+                box.alert = True
+            row = box.row()
+            row.scale_y = 1.5
+            row.operator("robotanim.select_mode", text=title, icon=icon).mode = mode_id
+            
+            desc = box.column()
+            for bullet in bullets:
+                desc.label(text=bullet)
         
         layout.separator()
         
         # Robot catalogue section
         catalogue_box = layout.box()
-        catalogue_box.label(text="🤖 Robot Catalogue", icon='WORLD')
+        catalogue_box.label(text=LABEL_CATALOGUE, icon='WORLD')
         
         if props.robot_catalogue_connected:
-            catalogue_box.label(text="✅ Connected to robot library")
+            catalogue_box.label(text=LABEL_CATALOGUE_CONNECTED)
             catalogue_box.operator("robotanim.browse_robots", 
                                   text="Browse Robot Models", 
                                   icon='WORLD_DATA')
         else:
-            catalogue_box.label(text="🔗 Connect to download robot models")
+            catalogue_box.label(text=LABEL_CATALOGUE_CONNECT)
             catalogue_box.operator("robotanim.connect_catalogue", 
                                   text="Connect to Robot Catalogue", 
                                   icon='URL')
@@ -171,12 +204,20 @@ class ROBOTANIM_OT_select_mode(Operator):
     bl_label = "Select Mode"
     bl_options = {'REGISTER', 'UNDO'}
     
-    mode: StringProperty()
+    mode: EnumProperty(
+        name="Mode",
+        items=[
+            ('simple', "Simple Mode", "Drag-and-drop interface for beginners"),
+            ('professional', "Professional Mode", "Extended Blender tools with robot features"),
+        ],
+        default='simple'
+    )
     
     def execute(self, context):
-        context.scene.startup_wizard.selected_mode = self.mode
-        context.scene.startup_wizard.setup_progress = 33
-        context.scene.startup_wizard.current_step = f"{self.mode.title()} Mode Selected"
+        with _wizard_update(context) as props:
+            props.selected_mode = self.mode
+            props.setup_progress = 33
+            props.current_step = f"{self.mode.title()} Mode Selected"
         
         self.report({'INFO'}, f"Selected {self.mode.title()} Mode")
         return {'FINISHED'}
@@ -188,25 +229,71 @@ class ROBOTANIM_OT_connect_catalogue(Operator):
     bl_label = "Connect to Robot Catalogue"
     bl_options = {'REGISTER', 'UNDO'}
     
-    def execute(self, context):
-        # Simulate catalogue connection with progress updates
-        props = context.scene.startup_wizard
-        
-        # Update progress
-        props.setup_progress = 66
-        props.current_step = "Connecting to Robot Catalogue..."
+    _timer = None
+    _results = None
+    
+    @staticmethod
+    def _open_catalogue():
+        """Open the catalogue in the browser, returning the exception on failure."""
+        import webbrowser
         
-        # Open robot catalogue website
-        catalogue_url = "https://robot-catalogue.com/models"  # Placeholder URL
         try:
-            webbrowser.open(catalogue_url)
-            props.robot_catalogue_connected = True
-            props.setup_progress = 90
-            props.current_step = "Robot Catalogue Connected"
-            self.report({'INFO'}, "Robot catalogue opened in browser")
+            webbrowser.open(CATALOGUE_URL)
         except Exception as e:
-            self.report({'ERROR'}, f"Failed to open catalogue: {str(e)}")
+            return e
+        return None
+    
+    def _start_connecting(self, context):
+        with _wizard_update(context) as props:
+            props.setup_progress = 66
+            props.current_step = "Connecting to Robot Catalogue..."
+    
+    def _finish(self, context, error):
+        if error is None:
+            with _wizard_update(context) as props:
+                props.robot_catalogue_connected = True
+                props.setup_progress = 90
+                props.current_step = "Robot Catalogue Connected"
+            self.report({'INFO'}, "Robot catalogue opened in browser")
+        else:
+            self.report({'ERROR'}, f"Failed to open catalogue: {str(error)}")
+    
+    def invoke(self, context, event):
+        # Open the browser off the UI thread; webbrowser.open can block for
+        # hundreds of milliseconds while the OS launches the browser
+        self._start_connecting(context)
         
+        results = queue.Queue()
+        self._results = results
+        threading.Thread(
+            target=lambda: results.put(self._open_catalogue()),
+            daemon=True
+        ).start()
+        
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        try:
+            error = self._results.get_nowait()
+        except queue.Empty:
+            return {'PASS_THROUGH'}
+        
+        context.window_manager.event_timer_remove(self._timer)
+        self._timer = None
+        self._finish(context, error)
+        return {'FINISHED'}
+    
+    def execute(self, context):
+        # Blocking path for scripted (non-interactive) calls
+        with _wizard_update(context):
+            self._start_connecting(context)
+            self._finish(context, self._open_catalogue())
         return {'FINISHED'}
 
 
@@ -258,7 +345,7 @@ class ROBOTANIM_OT_enter_simple_mode(Operator):
         
         # Set scene properties
         context.scene.robotanim_studio_mode = True
-        context.scene.robotanim_mode = 'simple'
+        context.scene['robotanim_mode'] = 'simple'
         
         # Show welcome message
         self.report({'INFO'}, "Simple Mode activated - drag and drop robot animation!")
@@ -271,13 +358,12 @@ class ROBOTANIM_OT_enter_simple_mode(Operator):
         context.preferences.view.show_tooltips_python = False
         
         # Set up viewport
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                for space in area.spaces:
-                    if space.type == 'VIEW_3D':
-                        space.shading.type = 'MATERIAL'
-                        space.overlay.show_grid = True
-                        space.show_gizmo_object_scale = False
+        view_spaces = [space for area in context.screen.areas if area.type == 'VIEW_3D'
+                       for space in area.spaces if space.type == 'VIEW_3D']
+        for space in view_spaces:
+            space.shading.type = 'MATERIAL'
+            space.overlay.show_grid = True
+            space.show_gizmo_object_scale = False
 
 
 class ROBOTANIM_OT_enter_professional_mode(Operator):
@@ -292,7 +378,7 @@ class ROBOTANIM_OT_enter_professional_mode(Operator):
         
         # Set scene properties
         context.scene.robotanim_studio_mode = False
-        context.scene.robotanim_mode = 'professional'
+        context.scene['robotanim_mode'] = 'professional'
         
         # Show welcome message
         self.report({'INFO'}, "Professional Mode activated - full Blender + robot tools!")
@@ -318,7 +404,7 @@ class ROBOTANIM_PT_startup_launcher(Panel):
     def poll(cls, context):
         # Only show if wizard hasn't been completed
         props = getattr(context.scene, 'startup_wizard', None)
-        return props is None or not hasattr(context.scene, 'robotanim_mode')
+        return props is None or context.scene.get('robotanim_mode') is None
     
     def draw(self, context):
         layout = self.layout
@@ -330,19 +416,19 @@ class ROBOTANIM_PT_startup_launcher(Panel):
         
         # Setup prompt
         setup_box = layout.box()
-        setup_box.label(text="🎯 Ready to animate robots?")
+        setup_box.label(text=LABEL_READY_TO_ANIMATE)
         setup_box.label(text="Let's get you set up in 2 minutes!")
         
         # Launch wizard button
         launch_row = setup_box.row()
         launch_row.scale_y = 2.0
         launch_row.operator("robotanim.startup_wizard", 
-                           text="🚀 Start Setup Wizard", 
+                           text=LABEL_START_WIZARD, 
                            icon='PLAY')
 
 
 # Registration
-startup_classes = [
+startup_classes = (
     StartupWizardProperties,
     ROBOTANIM_OT_startup_wizard,
     ROBOTANIM_OT_select_mode,
@@ -352,25 +438,25 @@ startup_classes = [
     ROBOTANIM_OT_enter_simple_mode,
     ROBOTANIM_OT_enter_professional_mode,
     ROBOTANIM_PT_startup_launcher,
-]
+)
+
+
+_register_startup_classes, _unregister_startup_classes = bpy.utils.register_classes_factory(startup_classes)
 
 
 def register_startup_wizard():
     """Register startup wizard classes."""
-    for cls in startup_classes:
-        bpy.utils.register_class(cls)
+    _register_startup_classes()
     
     # Register properties
     bpy.types.Scene.startup_wizard = bpy.props.PointerProperty(type=StartupWizardProperties)
-    bpy.types.Scene.robotanim_mode = bpy.props.StringProperty(default="")
+    # The chosen mode is stored as a plain scene["robotanim_mode"] ID property
 
 
 def unregister_startup_wizard():
     """Unregister startup wizard classes."""
     # Unregister properties
     del bpy.types.Scene.startup_wizard
-    del bpy.types.Scene.robotanim_mode
     
     # Unregister classes
-    for cls in reversed(startup_classes):
-        bpy.utils.unregister_class(cls) 
\ No newline at end of file
+    _unregister_startup_classes()
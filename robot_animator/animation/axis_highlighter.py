@@ -7,12 +7,46 @@ to show the primary movement directions for robot operations.
 """
 
 import logging
-import math
+import time
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple, Optional
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Highlight colour shared by every axis
+_BLUE = (0.0, 0.0, 1.0, 0.7)
+
+# Normalized direction for each axis key; combined keys are always alphabetical
+_AXIS_VECTORS = {
+    'x': (1.0, 0.0, 0.0),
+    'y': (0.0, 1.0, 0.0),
+    'z': (0.0, 0.0, 1.0),
+    'xy': (0.707, 0.707, 0.0),
+    'xz': (0.707, 0.0, 0.707),
+    'yz': (0.0, 0.707, 0.707)
+}
+
+# Axis names in component order
+_AXIS_NAMES = ('x', 'y', 'z')
+
+# Component indices covered by each axis key
+_AXIS_INDICES = {
+    'x': (0,),
+    'y': (1,),
+    'z': (2,),
+    'xy': (0, 1),
+    'xz': (0, 2),
+    'yz': (1, 2)
+}
+
+# Confidence mask over the per-axis totals and dominance weight for each axis key
+_CONF_MASKS = {
+    axis: (np.array([1.0 if i in indices else 0.0 for i in range(3)]),
+           2.0 if len(indices) == 1 else 1.5)
+    for axis, indices in _AXIS_INDICES.items()
+}
+
 
 class AxisHighlighter:
     """
@@ -22,6 +56,9 @@ class AxisHighlighter:
     and creates blue highlighting in the Blender scene.
     """
     
+    __slots__ = ('config', '_visualization_props', '_use_energy_metric', '_axis_length_factor',
+                 '_determine_main_axis_cached', '_default_axis_result')
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize AxisHighlighter.
@@ -29,16 +66,32 @@ class AxisHighlighter:
         Args:
             config: Optional configuration for axis highlighting
         """
-        self.config = config or self._default_config()
-        self.axis_colors = {
-            'x': (0.0, 0.0, 1.0, 0.7),  # Blue
-            'y': (0.0, 0.0, 1.0, 0.7),  # Blue
-            'z': (0.0, 0.0, 1.0, 0.7),  # Blue
-            'xy': (0.0, 0.0, 1.0, 0.7), # Blue
-            'xz': (0.0, 0.0, 1.0, 0.7), # Blue
-            'yz': (0.0, 0.0, 1.0, 0.7)  # Blue
+        self.config = config = config or self._default_config()
+        
+        # Visualization properties only depend on the configuration
+        self._visualization_props = {
+            'color': _BLUE,
+            'thickness': config['axis_thickness'],
+            'transparency': config['axis_transparency'],
+            'glow_enabled': config['enable_glow_effect'],
+            'pulse_enabled': config['enable_animation_pulse'],
+            'pulse_speed': config['pulse_speed'],
+            'material_type': 'emission' if config['enable_glow_effect'] else 'standard'
         }
         
+        # Scalars read on every analysis
+        self._use_energy_metric = config.get('dominance_metric') == 'energy'
+        self._axis_length_factor = config['axis_length_factor']
+        
+        # Per-instance result cache; the configuration is read once above, so use a
+        # new highlighter rather than editing self.config afterwards
+        self._determine_main_axis_cached = lru_cache(maxsize=128)(self._cached_main_axis)
+        
+        # Result returned when there are no targets and no custom workspace
+        self._default_axis_result = self._build_empty_axis_result({
+            'x': (-1, 1), 'y': (-1, 1), 'z': (0, 2)
+        })
+        
         logger.info("AxisHighlighter initialized")
     
     def _default_config(self) -> Dict[str, Any]:
@@ -52,6 +105,7 @@ class AxisHighlighter:
             'enable_animation_pulse': True,
             'pulse_speed': 2.0,
             'highlight_duration': -1,  # -1 for permanent
+            'dominance_metric': 'distance',  # 'distance' (sum of |d|) or 'energy' (sum of d^2)
             'blender_integration': True
         }
     
@@ -72,222 +126,274 @@ class AxisHighlighter:
                 'x': (-1, 1), 'y': (-1, 1), 'z': (0, 2)
             })
             
-            # Calculate movement vectors
-            movement_vectors = self._calculate_movement_vectors(robot_position, target_positions)
-            
-            # Analyze dominant movement directions
-            primary_axis = self._analyze_dominant_axis(movement_vectors)
+            # Nothing queued: the result only depends on the workspace bounds
+            if len(target_positions) == 0:
+                if 'workspace_bounds' not in process_data:
+                    return self._copy_axis_result(self._default_axis_result)
+                return self._build_empty_axis_result(workspace_bounds)
             
-            # Generate axis visualization points
-            axis_points = self._generate_axis_points(
-                robot_position, target_positions, primary_axis, workspace_bounds
+            # Identical inputs on consecutive frames are served from the cache
+            key = (
+                tuple(robot_position),
+                tuple(map(tuple, target_positions)),
+                tuple(sorted((axis, tuple(bounds)) for axis, bounds in workspace_bounds.items()))
             )
+            try:
+                hash(key)
+            except TypeError:
+                return self._compute_main_axis(robot_position, target_positions, workspace_bounds)
             
-            # Calculate axis vector
-            axis_vector = self._calculate_axis_vector(primary_axis)
+            return self._copy_axis_result(self._determine_main_axis_cached(*key))
             
-            # Generate visualization properties
-            visualization_props = self._generate_visualization_properties(primary_axis)
+        except Exception as e:
+            logger.error(f"Axis determination failed: {str(e)}")
+            raise
+    
+    def determine_main_axes_batch(self, robot_positions: Any, target_positions_batched: Any,
+                                  workspace_bounds: Optional[Dict[str, Tuple[float, float]]] = None
+                                  ) -> List[Dict[str, Any]]:
+        """
+        Determine the main animation axis for several robots in one vectorized pass.
+        
+        Args:
+            robot_positions: Robot positions, shape (B, 3)
+            target_positions_batched: Target positions per robot, shape (B, T, 3)
+            workspace_bounds: Workspace bounds shared by all robots
             
-            result = {
-                'primary_axis': primary_axis,
-                'axis_vector': axis_vector,
-                'axis_points': axis_points,
-                'movement_vectors': movement_vectors,
-                'visualization_props': visualization_props,
-                'confidence_score': self._calculate_axis_confidence(movement_vectors, primary_axis),
-                'workspace_bounds': workspace_bounds
-            }
+        Returns:
+            One result per robot, in the same format as determine_main_axis
+        """
+        try:
+            if workspace_bounds is None:
+                workspace_bounds = {'x': (-1, 1), 'y': (-1, 1), 'z': (0, 2)}
             
-            logger.info(f"Determined primary axis: {primary_axis}")
-            return result
+            robots = np.asarray(robot_positions, dtype=np.float64).reshape(-1, 3)
+            if len(robots) == 0:
+                return []
+            
+            targets = np.asarray(target_positions_batched, dtype=np.float64)
+            if targets.size == 0:
+                return [self._build_empty_axis_result(dict(workspace_bounds)) for _ in range(len(robots))]
+            targets = targets.reshape(len(robots), -1, 3)
+            
+            # Movement vectors and per-axis totals for every robot, shape (B, T, 3) and (B, 3)
+            vectors = targets - robots[:, None, :]
+            if self._use_energy_metric:
+                totals = np.einsum('bti,bti->bi', vectors, vectors)
+                combine_ratio = 0.6 ** 2
+            else:
+                totals = np.abs(vectors).sum(axis=1)
+                combine_ratio = 0.6
+            
+            # Rank axes per robot; stable so ties resolve in x, y, z order
+            order = np.argsort(-totals, axis=1, kind='stable')
+            rows = np.arange(len(robots))
+            primary_movement = totals[rows, order[:, 0]]
+            secondary_movement = totals[rows, order[:, 1]]
+            combined = secondary_movement > combine_ratio * primary_movement
+            
+            # Confidence from the dominance of the chosen axes
+            total_movement = totals.sum(axis=1)
+            covered = np.where(combined, primary_movement + secondary_movement, primary_movement)
+            weight = np.where(combined, 1.5, 2.0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                confidence = np.minimum(covered / total_movement * weight, 1.0)
+            confidence = np.where(total_movement == 0, 0.5, confidence)
+            
+            # Axis points only depend on the axis key, so build each one once
+            points_by_axis = {}
+            results = []
+            for b in range(len(robots)):
+                primary = _AXIS_NAMES[order[b, 0]]
+                if combined[b]:
+                    secondary = _AXIS_NAMES[order[b, 1]]
+                    primary = primary + secondary if primary < secondary else secondary + primary
+                
+                axis_points = points_by_axis.get(primary)
+                if axis_points is None:
+                    axis_points = self._generate_axis_points(None, [], primary, workspace_bounds)
+                    points_by_axis[primary] = axis_points
+                
+                results.append({
+                    'primary_axis': primary,
+                    'axis_vector': self._calculate_axis_vector(primary),
+                    'axis_points': [tuple(p) for p in axis_points.tolist()],
+                    'movement_vectors': [tuple(v) for v in vectors[b].tolist()],
+                    'visualization_props': self._generate_visualization_properties(primary),
+                    'confidence_score': float(confidence[b]),
+                    'workspace_bounds': dict(workspace_bounds)
+                })
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Determined primary axes for %d robots", len(results))
+            return results
             
         except Exception as e:
-            logger.error(f"Axis determination failed: {str(e)}")
+            logger.error(f"Batch axis determination failed: {str(e)}")
             raise
     
-    def _calculate_movement_vectors(self, robot_pos: Tuple[float, float, float], 
-                                   target_positions: List[Tuple[float, float, float]]) -> List[Tuple[float, float, float]]:
-        """Calculate movement vectors from robot position to targets."""
-        vectors = []
+    def _cached_main_axis(self, robot_position: Tuple[float, float, float],
+                          target_positions: Tuple[Tuple[float, float, float], ...],
+                          workspace_bounds: Tuple[Tuple[str, Tuple[float, float]], ...]) -> Dict[str, Any]:
+        """Compute the axis result from hashable inputs; wrapped in an LRU cache per instance."""
+        return self._compute_main_axis(robot_position, target_positions, dict(workspace_bounds))
+    
+    def _compute_main_axis(self, robot_position: Tuple[float, float, float],
+                           target_positions: List[Tuple[float, float, float]],
+                           workspace_bounds: Dict[str, Tuple[float, float]]) -> Dict[str, Any]:
+        """Run the full axis analysis for a non-empty set of targets."""
+        # Calculate movement vectors
+        movement_vectors = self._calculate_movement_vectors(robot_position, target_positions)
         
-        for target_pos in target_positions:
-            vector = (
-                target_pos[0] - robot_pos[0],
-                target_pos[1] - robot_pos[1], 
-                target_pos[2] - robot_pos[2]
-            )
-            vectors.append(vector)
+        # Analyze dominant movement directions
+        primary_axis, confidence_score = self._axis_stats(movement_vectors)
         
-        return vectors
-    
-    def _analyze_dominant_axis(self, movement_vectors: List[Tuple[float, float, float]]) -> str:
-        """Analyze movement vectors to determine dominant axis."""
-        if not movement_vectors:
-            return 'z'  # Default to vertical movement
+        # Generate axis visualization points
+        axis_points = self._generate_axis_points(
+            robot_position, target_positions, primary_axis, workspace_bounds
+        )
+        
+        # Calculate axis vector
+        axis_vector = self._calculate_axis_vector(primary_axis)
+        
+        # Generate visualization properties
+        visualization_props = self._generate_visualization_properties(primary_axis)
+        
+        result = {
+            'primary_axis': primary_axis,
+            'axis_vector': axis_vector,
+            'axis_points': [tuple(p) for p in axis_points.tolist()],
+            'movement_vectors': [tuple(v) for v in movement_vectors.tolist()],
+            'visualization_props': visualization_props,
+            'confidence_score': confidence_score,
+            'workspace_bounds': workspace_bounds
+        }
         
-        # Calculate total movement in each axis
-        total_x = sum(abs(v[0]) for v in movement_vectors)
-        total_y = sum(abs(v[1]) for v in movement_vectors)
-        total_z = sum(abs(v[2]) for v in movement_vectors)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Determined primary axis: %s", primary_axis)
+        return result
+    
+    def _build_empty_axis_result(self, workspace_bounds: Dict[str, Tuple[float, float]]) -> Dict[str, Any]:
+        """Build the axis result for a process with no target positions."""
+        axis_points = self._generate_axis_points(None, [], 'z', workspace_bounds)
+        return {
+            'primary_axis': 'z',
+            'axis_vector': self._calculate_axis_vector('z'),
+            'axis_points': [tuple(p) for p in axis_points.tolist()],
+            'movement_vectors': [],
+            'visualization_props': self._generate_visualization_properties('z'),
+            'confidence_score': 0.5,
+            'workspace_bounds': workspace_bounds
+        }
+    
+    def _copy_axis_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached axis result so callers can modify it freely."""
+        copied = dict(result)
+        copied['axis_points'] = list(result['axis_points'])
+        copied['movement_vectors'] = list(result['movement_vectors'])
+        copied['visualization_props'] = dict(result['visualization_props'])
+        copied['workspace_bounds'] = dict(result['workspace_bounds'])
+        return copied
+    
+    def _calculate_movement_vectors(self, robot_pos: Tuple[float, float, float], 
+                                   target_positions: List[Tuple[float, float, float]]) -> np.ndarray:
+        """Calculate movement vectors from robot position to targets as an (N, 3) array."""
+        targets = np.asarray(target_positions, dtype=np.float64).reshape(-1, 3)
+        robot = np.asarray(robot_pos, dtype=np.float64)
+        return targets - robot
+    
+    def _axis_stats(self, movement_vectors: np.ndarray) -> Tuple[str, float]:
+        """Determine the dominant axis and its confidence from one pass over the vectors."""
+        if len(movement_vectors) == 0:
+            return 'z', 0.5  # Default to vertical movement
         
-        # Determine primary and secondary axes
-        movements = {'x': total_x, 'y': total_y, 'z': total_z}
-        sorted_movements = sorted(movements.items(), key=lambda x: x[1], reverse=True)
+        # Total movement in each axis, shared by both analyses
+        if self._use_energy_metric:
+            # Squared lengths, so the combine ratio is squared as well
+            totals = np.einsum('ni,ni->i', movement_vectors, movement_vectors)
+            combine_ratio = 0.6 ** 2
+        else:
+            totals = np.abs(movement_vectors).sum(axis=0)
+            combine_ratio = 0.6
         
-        primary = sorted_movements[0][0]
-        secondary = sorted_movements[1][0]
+        primary_axis = self._analyze_dominant_axis(totals, combine_ratio)
+        return primary_axis, self._calculate_axis_confidence(totals, primary_axis)
+    
+    def _analyze_dominant_axis(self, totals: np.ndarray, combine_ratio: float = 0.6) -> str:
+        """Determine dominant axis from per-axis movement totals."""
+        total_x, total_y, total_z = totals.tolist()
         
-        # Check if movement is significant in multiple axes
-        primary_movement = sorted_movements[0][1]
-        secondary_movement = sorted_movements[1][1]
+        # Determine primary and secondary axes; ties resolve in x, y, z order
+        if total_x >= total_y and total_x >= total_z:
+            primary, primary_movement = 'x', total_x
+            secondary, secondary_movement = ('y', total_y) if total_y >= total_z else ('z', total_z)
+        elif total_y >= total_z:
+            primary, primary_movement = 'y', total_y
+            secondary, secondary_movement = ('x', total_x) if total_x >= total_z else ('z', total_z)
+        else:
+            primary, primary_movement = 'z', total_z
+            secondary, secondary_movement = ('x', total_x) if total_x >= total_y else ('y', total_y)
         
-        # If secondary movement is significant (>60% of primary), combine axes
-        if secondary_movement > 0.6 * primary_movement:
-            combined_axes = ''.join(sorted([primary, secondary]))
-            return combined_axes
+        # If secondary movement is significant (>60% of primary by default), combine axes
+        if secondary_movement > combine_ratio * primary_movement:
+            # Combined keys are always in alphabetical order ('xy', 'xz', 'yz')
+            return primary + secondary if primary < secondary else secondary + primary
         
         return primary
     
     def _generate_axis_points(self, robot_pos: Tuple[float, float, float],
                              target_positions: List[Tuple[float, float, float]],
                              primary_axis: str,
-                             workspace_bounds: Dict[str, Tuple[float, float]]) -> List[Tuple[float, float, float]]:
-        """Generate points for axis visualization."""
+                             workspace_bounds: Dict[str, Tuple[float, float]]) -> np.ndarray:
+        """Generate the (2, 3) start/end points for axis visualization."""
+        bounds = np.array([workspace_bounds['x'], workspace_bounds['y'], workspace_bounds['z']],
+                          dtype=np.float64)
         
         # Calculate workspace center
-        center_x = (workspace_bounds['x'][0] + workspace_bounds['x'][1]) / 2
-        center_y = (workspace_bounds['y'][0] + workspace_bounds['y'][1]) / 2
-        center_z = (workspace_bounds['z'][0] + workspace_bounds['z'][1]) / 2
-        workspace_center = (center_x, center_y, center_z)
+        center = (bounds[:, 0] + bounds[:, 1]) * 0.5
         
-        # Extend axis based on workspace bounds
-        extension_factor = self.config['axis_length_factor']
+        # Single axes are extended past the workspace, diagonals span it exactly,
+        # anything unrecognised falls back to the vertical axis
+        indices = _AXIS_INDICES.get(primary_axis)
+        if indices is None:
+            indices, extend = (2,), False
+        else:
+            extend = len(indices) == 1
         
-        if primary_axis == 'x':
-            x_range = workspace_bounds['x']
-            x_extended = (
-                x_range[0] - (x_range[1] - x_range[0]) * 0.1 * extension_factor,
-                x_range[1] + (x_range[1] - x_range[0]) * 0.1 * extension_factor
-            )
-            return [
-                (x_extended[0], workspace_center[1], workspace_center[2]),
-                (x_extended[1], workspace_center[1], workspace_center[2])
-            ]
-        
-        elif primary_axis == 'y':
-            y_range = workspace_bounds['y']
-            y_extended = (
-                y_range[0] - (y_range[1] - y_range[0]) * 0.1 * extension_factor,
-                y_range[1] + (y_range[1] - y_range[0]) * 0.1 * extension_factor
-            )
-            return [
-                (workspace_center[0], y_extended[0], workspace_center[2]),
-                (workspace_center[0], y_extended[1], workspace_center[2])
-            ]
-        
-        elif primary_axis == 'z':
-            z_range = workspace_bounds['z']
-            z_extended = (
-                z_range[0] - (z_range[1] - z_range[0]) * 0.1 * extension_factor,
-                z_range[1] + (z_range[1] - z_range[0]) * 0.1 * extension_factor
-            )
-            return [
-                (workspace_center[0], workspace_center[1], z_extended[0]),
-                (workspace_center[0], workspace_center[1], z_extended[1])
-            ]
-        
-        elif primary_axis in ['xy', 'yx']:
-            # Diagonal movement in XY plane
-            x_range = workspace_bounds['x']
-            y_range = workspace_bounds['y']
-            return [
-                (x_range[0], y_range[0], workspace_center[2]),
-                (x_range[1], y_range[1], workspace_center[2])
-            ]
+        mask = np.zeros(3, dtype=bool)
+        mask[list(indices)] = True
         
-        elif primary_axis in ['xz', 'zx']:
-            # Diagonal movement in XZ plane
-            x_range = workspace_bounds['x']
-            z_range = workspace_bounds['z']
-            return [
-                (x_range[0], workspace_center[1], z_range[0]),
-                (x_range[1], workspace_center[1], z_range[1])
-            ]
+        delta = (bounds[:, 1] - bounds[:, 0]) * 0.1 * self._axis_length_factor
+        if not extend:
+            delta[:] = 0.0
         
-        elif primary_axis in ['yz', 'zy']:
-            # Diagonal movement in YZ plane
-            y_range = workspace_bounds['y']
-            z_range = workspace_bounds['z']
-            return [
-                (workspace_center[0], y_range[0], z_range[0]),
-                (workspace_center[0], y_range[1], z_range[1])
-            ]
-        
-        # Default: vertical axis
-        return [
-            (workspace_center[0], workspace_center[1], workspace_bounds['z'][0]),
-            (workspace_center[0], workspace_center[1], workspace_bounds['z'][1])
-        ]
+        start = np.where(mask, bounds[:, 0] - delta, center)
+        end = np.where(mask, bounds[:, 1] + delta, center)
+        return np.stack((start, end))
     
     def _calculate_axis_vector(self, primary_axis: str) -> Tuple[float, float, float]:
         """Calculate normalized axis vector."""
-        axis_vectors = {
-            'x': (1.0, 0.0, 0.0),
-            'y': (0.0, 1.0, 0.0),
-            'z': (0.0, 0.0, 1.0),
-            'xy': (0.707, 0.707, 0.0),
-            'yx': (0.707, 0.707, 0.0),
-            'xz': (0.707, 0.0, 0.707),
-            'zx': (0.707, 0.0, 0.707),
-            'yz': (0.0, 0.707, 0.707),
-            'zy': (0.0, 0.707, 0.707)
-        }
-        
-        return axis_vectors.get(primary_axis, (0.0, 0.0, 1.0))
+        return _AXIS_VECTORS.get(primary_axis, (0.0, 0.0, 1.0))
     
     def _generate_visualization_properties(self, primary_axis: str) -> Dict[str, Any]:
         """Generate visualization properties for the axis."""
-        return {
-            'color': self.axis_colors.get(primary_axis, (0.0, 0.0, 1.0, 0.7)),
-            'thickness': self.config['axis_thickness'],
-            'transparency': self.config['axis_transparency'],
-            'glow_enabled': self.config['enable_glow_effect'],
-            'pulse_enabled': self.config['enable_animation_pulse'],
-            'pulse_speed': self.config['pulse_speed'],
-            'material_type': 'emission' if self.config['enable_glow_effect'] else 'standard'
-        }
+        # Every axis shares the same properties; copy so callers may edit theirs
+        return dict(self._visualization_props)
     
-    def _calculate_axis_confidence(self, movement_vectors: List[Tuple[float, float, float]], 
-                                  primary_axis: str) -> float:
-        """Calculate confidence score for axis determination."""
-        if not movement_vectors:
-            return 0.5
-        
-        # Calculate total movement in each axis
-        total_x = sum(abs(v[0]) for v in movement_vectors)
-        total_y = sum(abs(v[1]) for v in movement_vectors)
-        total_z = sum(abs(v[2]) for v in movement_vectors)
+    def _calculate_axis_confidence(self, totals: np.ndarray, primary_axis: str) -> float:
+        """Calculate confidence score for axis determination from per-axis movement totals."""
+        total_x, total_y, total_z = totals.tolist()
         
         total_movement = total_x + total_y + total_z
         if total_movement == 0:
             return 0.5
         
         # Calculate confidence based on dominance of the primary axis
-        if primary_axis == 'x':
-            return min(total_x / total_movement * 2.0, 1.0)
-        elif primary_axis == 'y':
-            return min(total_y / total_movement * 2.0, 1.0)
-        elif primary_axis == 'z':
-            return min(total_z / total_movement * 2.0, 1.0)
-        elif primary_axis in ['xy', 'yx']:
-            return min((total_x + total_y) / total_movement * 1.5, 1.0)
-        elif primary_axis in ['xz', 'zx']:
-            return min((total_x + total_z) / total_movement * 1.5, 1.0)
-        elif primary_axis in ['yz', 'zy']:
-            return min((total_y + total_z) / total_movement * 1.5, 1.0)
+        mask, weight = _CONF_MASKS.get(primary_axis, (None, None))
+        if mask is None:
+            return 0.5
         
-        return 0.5
+        return min(float(mask @ totals) / total_movement * weight, 1.0)
     
     def highlight_in_blender(self, axis_data: Dict[str, Any], 
                            highlight_config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -312,7 +418,8 @@ class AxisHighlighter:
             else:
                 result = self._simulate_axis_highlight(axis_data, config)
             
-            logger.info(f"Highlighted {axis_data['primary_axis']} axis in blue")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Highlighted %s axis in blue", axis_data['primary_axis'])
             return result
             
         except Exception as e:
@@ -330,7 +437,7 @@ class AxisHighlighter:
             # import bpy
             # import bmesh
             
-            axis_points = axis_data['axis_points']
+            axis_points = np.asarray(axis_data['axis_points'], dtype=np.float64)
             visualization_props = axis_data['visualization_props']
             
             # Simulate creating a cylinder for the axis
@@ -392,23 +499,14 @@ class AxisHighlighter:
             }
         }
     
-    def _calculate_distance(self, point1: Tuple[float, float, float], 
-                           point2: Tuple[float, float, float]) -> float:
+    def _calculate_distance(self, point1: np.ndarray, point2: np.ndarray) -> float:
         """Calculate distance between two 3D points."""
-        return math.sqrt(
-            (point2[0] - point1[0])**2 + 
-            (point2[1] - point1[1])**2 + 
-            (point2[2] - point1[2])**2
-        )
+        return float(np.linalg.norm(point2 - point1))
     
-    def _calculate_midpoint(self, point1: Tuple[float, float, float], 
-                           point2: Tuple[float, float, float]) -> Tuple[float, float, float]:
+    def _calculate_midpoint(self, point1: np.ndarray, 
+                           point2: np.ndarray) -> Tuple[float, float, float]:
         """Calculate midpoint between two 3D points."""
-        return (
-            (point1[0] + point2[0]) / 2,
-            (point1[1] + point2[1]) / 2,
-            (point1[2] + point2[2]) / 2
-        )
+        return tuple(((point1 + point2) * 0.5).tolist())
     
     def update_axis_highlight(self, axis_object_name: str, 
                              new_properties: Dict[str, Any]) -> Dict[str, Any]:
@@ -420,11 +518,12 @@ class AxisHighlighter:
             updated_properties = {
                 'object_name': axis_object_name,
                 'updated_properties': new_properties,
-                'update_timestamp': logging.time.time(),
+                'update_timestamp': time.monotonic_ns(),
                 'success': True
             }
             
-            logger.info(f"Updated axis highlight: {axis_object_name}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Updated axis highlight: %s", axis_object_name)
             return updated_properties
             
         except Exception as e:
@@ -440,10 +539,11 @@ class AxisHighlighter:
             result = {
                 'object_name': axis_object_name,
                 'removed': True,
-                'removal_timestamp': logging.time.time()
+                'removal_timestamp': time.monotonic_ns()
             }
             
-            logger.info(f"Removed axis highlight: {axis_object_name}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Removed axis highlight: %s", axis_object_name)
             return result
             
         except Exception as e:
@@ -6,13 +6,204 @@ Manages progressive animation quality improvement starting from low-quality
 previews and advancing to high-quality final renders.
 """
 
+import hashlib
 import logging
+import os
+import subprocess
+import tempfile
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Dict, Any, Optional, List, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+def _default_frame_cache_bytes() -> int:
+    """Half of physical memory, kept between 500 MB and 20 GB; 1 GB where it cannot be read."""
+    try:
+        physical = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (AttributeError, ValueError, OSError):
+        # os.sysconf does not exist on Windows
+        return 1 << 30
+    return min(max(physical // 2, 500 * 1024 * 1024), 20 * 1024 ** 3)
+
+
+# Budget for cached rendered frames, read once at import
+_FRAME_CACHE_BYTES = _default_frame_cache_bytes()
+
+# Default configuration for iterative animation
+_DEFAULT_CONFIG = MappingProxyType({
+    'start_quality': 'low',
+    'max_quality': 'high',
+    'auto_progression': False,
+    'preview_duration': 5.0,
+    'cache_animations': True,
+    'real_time_feedback': True,
+    'blender_integration': True,
+    'progress_update_interval_ms': 100,  # minimum time between progress recomputations
+    'parallel_scene_setup': False,  # overlap independent scene setup steps on threads
+    'history_size': 128,  # most recent animation starts kept in animation_history
+    'render_devices': 1,
+    'render_concurrency': 'serial',  # 'serial' or 'parallel' (one chain per device, capped at CPU count)
+    'frame_cache_bytes': _FRAME_CACHE_BYTES,  # budget for cached rendered frames
+    'output_formats': ('mp4', 'avi', 'mov'),
+    'temp_render_dir': 'temp_renders/'
+})
+
+# Quality presets for different animation levels
+_QUALITY_PRESETS = MappingProxyType({
+    'low': MappingProxyType({
+        'frame_rate': 12,
+        'resolution': MappingProxyType({'width': 640, 'height': 480}),
+        'render_samples': 8,
+        'motion_blur': False,
+        'subsurface_scattering': False,
+        'volumetrics': False,
+        'lighting_quality': 'basic',
+        'shadow_quality': 'low',
+        'material_complexity': 'simple',
+        'particle_count': 100,
+        'subdivision_levels': 0,
+        'render_time_estimate': 0.5  # minutes per second of animation
+    }),
+    'medium': MappingProxyType({
+        'frame_rate': 24,
+        'resolution': MappingProxyType({'width': 1280, 'height': 720}),
+        'render_samples': 32,
+        'motion_blur': True,
+        'subsurface_scattering': False,
+        'volumetrics': True,
+        'lighting_quality': 'good',
+        'shadow_quality': 'medium',
+        'material_complexity': 'standard',
+        'particle_count': 500,
+        'subdivision_levels': 1,
+        'render_time_estimate': 2.0
+    }),
+    'high': MappingProxyType({
+        'frame_rate': 30,
+        'resolution': MappingProxyType({'width': 1920, 'height': 1080}),
+        'render_samples': 128,
+        'motion_blur': True,
+        'subsurface_scattering': True,
+        'volumetrics': True,
+        'lighting_quality': 'excellent',
+        'shadow_quality': 'high',
+        'material_complexity': 'advanced',
+        'particle_count': 1000,
+        'subdivision_levels': 2,
+        'render_time_estimate': 8.0
+    }),
+    'ultra': MappingProxyType({
+        'frame_rate': 60,
+        'resolution': MappingProxyType({'width': 3840, 'height': 2160}),  # 4K
+        'render_samples': 512,
+        'motion_blur': True,
+        'subsurface_scattering': True,
+        'volumetrics': True,
+        'lighting_quality': 'photorealistic',
+        'shadow_quality': 'ultra',
+        'material_complexity': 'photorealistic',
+        'particle_count': 2000,
+        'subdivision_levels': 3,
+        'render_time_estimate': 20.0
+    })
+})
+
+def _plain(value):
+    """Deep copy of a read-only preset mapping as plain dicts, for returning to callers."""
+    if isinstance(value, MappingProxyType):
+        return {key: _plain(item) for key, item in value.items()}
+    return value
+
+
+# Frame batches queued per render device, so faster devices can pick up more work
+_TILES_PER_DEVICE = 6
+
+# Animation config keys that only select the quality, not the scene content
+_RENDER_ONLY_KEYS = frozenset({'quality_level'})
+
+# Preset fields that change the rendered frames; presets agreeing on all of them render alike
+_RENDER_AFFECTING = frozenset({'frame_rate', 'resolution', 'render_samples', 'motion_blur', 'subdivision_levels'})
+
+# Video codec used when piping raw frames to ffmpeg, per output format
+_ENCODER_CODECS = MappingProxyType({'mp4': 'libx264', 'mov': 'libx264', 'avi': 'mpeg4'})
+
+# Scene components whose change means new geometry rather than moved geometry
+_GEOMETRY_COMPONENTS = frozenset({'robot', 'environment', 'process'})
+
+# Preview cache: small low/medium previews keep their pixels, the rest keep draw parameters
+_PREVIEW_QUALITIES = frozenset({'low', 'medium'})
+_RASTER_CACHE_BYTES = 50 * 1024 * 1024
+_PREVIEW_CACHE_SIZE = 32
+
+# Robot models available to load, as (lowercase match key, display name)
+_ROBOT_KEYS = tuple(
+    (name.lower(), name)
+    for name in ('ABB', 'KUKA', 'FANUC', 'Universal Robots', 'Generic Robot')
+)
+
+# Environment presets
+_ENVIRONMENT_PRESETS = {
+    'manufacturing_plant': {
+        'floor_material': 'concrete',
+        'walls': 'industrial_metal',
+        'machinery': True,
+        'safety_markings': True
+    },
+    'assembly_line': {
+        'conveyor_belts': True,
+        'workstations': True,
+        'overhead_lighting': True,
+        'safety_barriers': True
+    },
+    'clean_room': {
+        'sterile_surfaces': True,
+        'controlled_lighting': True,
+        'air_flow_visualization': True,
+        'contamination_protocols': True
+    },
+    'warehouse': {
+        'storage_racks': True,
+        'floor_markings': True,
+        'industrial_lighting': True,
+        'material_handling_equipment': True
+    }
+}
+
+# Environment match keys, as (phrase to find, preset name)
+_ENV_KEYS = tuple((name.replace('_', ' '), name) for name in _ENVIRONMENT_PRESETS)
+
+# Ordering of quality levels, lowest first
+_QUALITY_RANK = MappingProxyType({'low': 0, 'medium': 1, 'high': 2, 'ultra': 3})
+
+# Estimated output file size in MB per quality level
+_FILE_SIZE_ESTIMATES = MappingProxyType({
+    'low': 50,
+    'medium': 200,
+    'high': 800,
+    'ultra': 2000
+})
+
+# Human-readable comparison of the quality presets
+_QUALITY_COMPARISON = MappingProxyType({
+    quality: MappingProxyType({
+        'resolution': f"{settings['resolution']['width']}x{settings['resolution']['height']}",
+        'frame_rate': settings['frame_rate'],
+        'render_time_estimate': f"{settings['render_time_estimate']} min/sec",
+        'file_size_estimate': f"{_FILE_SIZE_ESTIMATES.get(quality, 200)} MB",
+        'features': MappingProxyType({
+            'motion_blur': settings['motion_blur'],
+            'volumetrics': settings['volumetrics'],
+            'subsurface_scattering': settings['subsurface_scattering']
+        })
+    })
+    for quality, settings in _QUALITY_PRESETS.items()
+})
+
+
 class IterativeAnimator:
     """
     Iterative animation system for progressive quality improvement.
@@ -31,84 +222,36 @@ class IterativeAnimator:
         self.config = config or self._default_config()
         self.quality_presets = self._load_quality_presets()
         self.current_animation = None
-        self.animation_history = []
+        self.animation_history = deque(maxlen=self.config.get('history_size', 128))
+        self._next_animation_id = 1
+        
+        # (frame path, size in bytes) keyed by (scene_hash, frame, quality_level), oldest first
+        self._frame_cache = OrderedDict()
+        self._frame_cache_bytes = 0
+        
+        # Inputs of the last scene setup, used to skip unchanged setup steps
+        self._scene_state = {}
+        
+        # Previews keyed by (scene_hash, quality_level), oldest first
+        self._preview_cache = OrderedDict()
+        self._raster_cache_bytes = 0
+        
+        # (monotonic timestamp, result) of the last progress computation
+        self._last_progress = None
+        self._progress_interval = self.config.get('progress_update_interval_ms', 100) / 1000.0
+        
+        # Scratch parameters refilled for every render start
+        self._animation_params = {}
         
         logger.info("IterativeAnimator initialized")
     
     def _default_config(self) -> Dict[str, Any]:
         """Return default configuration for iterative animation."""
-        return {
-            'start_quality': 'low',
-            'max_quality': 'high',
-            'auto_progression': False,
-            'preview_duration': 5.0,
-            'cache_animations': True,
-            'real_time_feedback': True,
-            'blender_integration': True,
-            'output_formats': ['mp4', 'avi', 'mov'],
-            'temp_render_dir': 'temp_renders/'
-        }
+        return dict(_DEFAULT_CONFIG)
     
     def _load_quality_presets(self) -> Dict[str, Dict[str, Any]]:
         """Load quality presets for different animation levels."""
-        return {
-            'low': {
-                'frame_rate': 12,
-                'resolution': {'width': 640, 'height': 480},
-                'render_samples': 8,
-                'motion_blur': False,
-                'subsurface_scattering': False,
-                'volumetrics': False,
-                'lighting_quality': 'basic',
-                'shadow_quality': 'low',
-                'material_complexity': 'simple',
-                'particle_count': 100,
-                'subdivision_levels': 0,
-                'render_time_estimate': 0.5  # minutes per second of animation
-            },
-            'medium': {
-                'frame_rate': 24,
-                'resolution': {'width': 1280, 'height': 720},
-                'render_samples': 32,
-                'motion_blur': True,
-                'subsurface_scattering': False,
-                'volumetrics': True,
-                'lighting_quality': 'good',
-                'shadow_quality': 'medium',
-                'material_complexity': 'standard',
-                'particle_count': 500,
-                'subdivision_levels': 1,
-                'render_time_estimate': 2.0
-            },
-            'high': {
-                'frame_rate': 30,
-                'resolution': {'width': 1920, 'height': 1080},
-                'render_samples': 128,
-                'motion_blur': True,
-                'subsurface_scattering': True,
-                'volumetrics': True,
-                'lighting_quality': 'excellent',
-                'shadow_quality': 'high',
-                'material_complexity': 'advanced',
-                'particle_count': 1000,
-                'subdivision_levels': 2,
-                'render_time_estimate': 8.0
-            },
-            'ultra': {
-                'frame_rate': 60,
-                'resolution': {'width': 3840, 'height': 2160},  # 4K
-                'render_samples': 512,
-                'motion_blur': True,
-                'subsurface_scattering': True,
-                'volumetrics': True,
-                'lighting_quality': 'photorealistic',
-                'shadow_quality': 'ultra',
-                'material_complexity': 'photorealistic',
-                'particle_count': 2000,
-                'subdivision_levels': 3,
-                'render_time_estimate': 20.0
-            }
-        }
+        return _QUALITY_PRESETS
     
     def start_animation(self, animation_config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -136,7 +279,9 @@ class IterativeAnimator:
                 return {'success': False, 'error': 'Scene setup failed'}
             
             # Configure animation parameters
-            animation_params = self._configure_animation_parameters(animation_config, quality_settings)
+            animation_params = self._configure_animation_parameters(
+                animation_config, quality_settings, self._animation_params
+            )
             
             # Start rendering/preview
             render_result = self._start_animation_render(animation_params, quality_level)
@@ -145,33 +290,52 @@ class IterativeAnimator:
             self.current_animation = {
                 'config': animation_config,
                 'quality_level': quality_level,
-                'settings': quality_settings,
+                'settings': _plain(quality_settings),
+                'estimated_total_seconds': quality_settings['render_time_estimate'] * 60.0,
                 'start_time': time.time(),
-                'status': 'rendering'
+                'status': 'rendering',
+                'device_progress': dict.fromkeys(render_result['device_batches'], 0),
+                'render_result': render_result
             }
+            self._last_progress = None
             
             # Add to history
             self.animation_history.append(self.current_animation.copy())
+            animation_id = self._next_animation_id
+            self._next_animation_id += 1
             
             result = {
                 'success': True,
                 'quality': quality_level,
                 'frame_rate': quality_settings['frame_rate'],
-                'resolution': quality_settings['resolution'],
+                'resolution': dict(quality_settings['resolution']),
                 'render_samples': quality_settings['render_samples'],
                 'estimated_render_time': animation_params['estimated_render_time'],
-                'animation_id': len(self.animation_history),
+                'animation_id': animation_id,
                 'render_result': render_result,
                 'preview_available': quality_level in ['low', 'medium']
             }
             
-            logger.info(f"Started {quality_level} quality animation")
+            logger.info("Started %s quality animation", quality_level)
             return result
             
         except Exception as e:
             logger.error(f"Animation start failed: {str(e)}")
             return {'success': False, 'error': str(e)}
     
+    def start_animation_batch(self, animation_configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Start several animations one after another.
+        
+        Args:
+            animation_configs: Configurations to start, in order
+            
+        Returns:
+            List of start_animation results in the same order
+        """
+        # Jobs run as one serial chain; parallelism stays inside each render
+        return [self.start_animation(animation_config) for animation_config in animation_configs]
+    
     def setup_animation_scene(self, animation_config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Setup Blender scene for animation.
@@ -188,20 +352,61 @@ class IterativeAnimator:
             environment = animation_config.get('environment', 'industrial')
             lighting = animation_config.get('lighting', 'industrial')
             
+            # Only redo the parts of the scene whose inputs changed since the last setup
+            scene_state = {
+                'robot': robot_type,
+                'environment': environment,
+                'lighting': lighting,
+                'process': process_type,
+                'timeline': animation_config.get('animation_duration', 10.0),
+                'robot_positions': hash(repr(animation_config.get('robot_positions')))
+            }
+            dirty = {
+                key for key, value in scene_state.items()
+                if key not in self._scene_state or self._scene_state[key] != value
+            }
+            
+            # Independent setup steps for the components that changed
+            steps = []
+            if 'robot' in dirty:
+                steps.append(('robot_loaded', self._load_robot_model, robot_type))
+            if 'environment' in dirty:
+                steps.append(('environment_set', self._setup_environment, environment))
+            if 'lighting' in dirty:
+                steps.append(('lighting_configured', self._setup_lighting, lighting))
+            if 'process' in dirty:
+                steps.append(('camera_positioned', self._position_cameras, process_type))
+                steps.append(('materials_loaded', self._load_materials, process_type))
+            
             # Scene setup simulation (would use real Blender API in production)
+            if self.config.get('parallel_scene_setup', False) and len(steps) > 1:
+                # Asset loads are IO-bound, so overlap them on worker threads
+                with ThreadPoolExecutor(max_workers=len(steps)) as pool:
+                    outcomes = list(pool.map(lambda step: step[1](step[2]), steps))
+            else:
+                outcomes = [step(argument) for _, step, argument in steps]
+            
             scene_setup_result = {
                 'scene_configured': True,
-                'robot_loaded': self._load_robot_model(robot_type),
-                'environment_set': self._setup_environment(environment),
-                'lighting_configured': self._setup_lighting(lighting),
-                'camera_positioned': self._position_cameras(process_type),
-                'materials_loaded': self._load_materials(process_type)
+                'robot_loaded': True,
+                'environment_set': True,
+                'lighting_configured': True,
+                'camera_positioned': True,
+                'materials_loaded': True,
+                'dirty_components': sorted(dirty),
+                # Moving robots only need the BVH refitted; new geometry needs a rebuild
+                'bvh_update_mode': 'rebuild' if dirty & _GEOMETRY_COMPONENTS else 'refit'
             }
+            for (result_key, _, _), outcome in zip(steps, outcomes):
+                scene_setup_result[result_key] = outcome
             
             # Configure animation timeline
-            self._configure_timeline(animation_config)
+            if 'timeline' in dirty:
+                self._configure_timeline(animation_config)
+            
+            self._scene_state = scene_state
             
-            logger.info(f"Scene configured for {process_type} with {robot_type}")
+            logger.info("Scene configured for %s with %s", process_type, robot_type)
             return scene_setup_result
             
         except Exception as e:
@@ -209,8 +414,9 @@ class IterativeAnimator:
             return {'scene_configured': False, 'error': str(e)}
     
     def _configure_animation_parameters(self, animation_config: Dict[str, Any], 
-                                       quality_settings: Dict[str, Any]) -> Dict[str, Any]:
-        """Configure animation parameters based on config and quality."""
+                                       quality_settings: Dict[str, Any],
+                                       params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Configure animation parameters based on config and quality, filling params if given."""
         
         animation_duration = animation_config.get('animation_duration', 10.0)
         robot_positions = animation_config.get('robot_positions', [(0, 0, 1), (0.5, 0.3, 0.8)])
@@ -223,16 +429,18 @@ class IterativeAnimator:
         render_time_per_second = quality_settings['render_time_estimate']
         estimated_render_time = animation_duration * render_time_per_second
         
-        return {
-            'animation_duration': animation_duration,
-            'total_frames': total_frames,
-            'frame_rate': frame_rate,
-            'robot_positions': robot_positions,
-            'estimated_render_time': estimated_render_time,
-            'quality_settings': quality_settings,
-            'output_resolution': quality_settings['resolution'],
-            'render_samples': quality_settings['render_samples']
-        }
+        if params is None:
+            params = {}
+        params['scene_hash'] = self._scene_hash(animation_config)
+        params['animation_duration'] = animation_duration
+        params['total_frames'] = total_frames
+        params['frame_rate'] = frame_rate
+        params['robot_positions'] = robot_positions
+        params['estimated_render_time'] = estimated_render_time
+        params['quality_settings'] = quality_settings
+        params['output_resolution'] = quality_settings['resolution']
+        params['render_samples'] = quality_settings['render_samples']
+        return params
     
     def _start_animation_render(self, animation_params: Dict[str, Any], 
                                quality_level: str) -> Dict[str, Any]:
@@ -243,72 +451,169 @@ class IterativeAnimator:
         
         total_frames = animation_params['total_frames']
         estimated_time = animation_params['estimated_render_time']
+        now = time.time()
+        
+        # Frames already rendered for this scene at this quality are reused
+        cached_frames = self._lookup_cached_frames(animation_params, quality_level)
+        
+        # Split the timeline into batches and deal them out across the render devices,
+        # dropping batches whose frames are all cached
+        render_devices = self._render_worker_count()
+        frame_batches = [
+            (start, end) for start, end in self._partition_frames(total_frames, render_devices)
+            if any(frame not in cached_frames for frame in range(start, end + 1))
+        ]
+        device_batches = {device: frame_batches[device::render_devices] for device in range(render_devices)}
         
         render_result = {
             'render_started': True,
             'total_frames': total_frames,
-            'estimated_completion_time': time.time() + estimated_time * 60,  # Convert to seconds
+            'estimated_completion_time': now + estimated_time * 60,  # Convert to seconds
             'quality_level': quality_level,
             'output_format': 'mp4',
-            'preview_frames': min(total_frames, 30) if quality_level == 'low' else 0
+            'preview_frames': min(total_frames, 30) if quality_level == 'low' else 0,
+            'render_devices': render_devices,
+            'frame_batches': frame_batches,
+            'device_batches': device_batches,
+            'cached_frames': len(cached_frames)
         }
         
+        self._store_rendered_frames(animation_params, quality_level, cached_frames)
+        
         # Simulate quick preview for low quality
         if quality_level == 'low':
             render_result['preview_ready'] = True
-            render_result['preview_path'] = f"temp_renders/preview_{quality_level}_{int(time.time())}.mp4"
+            render_result['preview_path'] = f"temp_renders/preview_{quality_level}_{int(now)}.mp4"
+        
+        # Repeated previews of the same scene and quality come straight from the preview cache
+        preview_key = (animation_params['scene_hash'], quality_level)
+        preview = self._preview_cache.get(preview_key)
+        if preview is not None:
+            self._preview_cache.move_to_end(preview_key)
+            render_result['preview_cached'] = True
+        else:
+            preview = self._cache_preview(preview_key, animation_params, render_result)
+            render_result['preview_cached'] = False
+        render_result['preview_cache_tier'] = preview['tier']
         
         return render_result
     
+    def _cache_preview(self, preview_key: Tuple[bytes, str], animation_params: Dict[str, Any],
+                       render_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a small rendered preview by its file, otherwise by its draw parameters."""
+        quality_level = preview_key[1]
+        resolution = animation_params['output_resolution']
+        raster_bytes = resolution['width'] * resolution['height'] * 4 * animation_params['total_frames']
+        preview_path = render_result.get('preview_path')
+        
+        if preview_path and quality_level in _PREVIEW_QUALITIES and raster_bytes < _RASTER_CACHE_BYTES:
+            # Budgeted at the decoded size of its frames, which is what a redraw holds
+            preview = {'tier': 'raster', 'bytes': raster_bytes, 'frames': preview_path}
+            self._raster_cache_bytes += raster_bytes
+        else:
+            # Enough to redraw the preview without holding its pixels
+            preview = {'tier': 'drawing_commands', 'bytes': 0,
+                       'frames': (animation_params['total_frames'], animation_params['frame_rate'],
+                                  animation_params['render_samples'])}
+        self._preview_cache[preview_key] = preview
+        
+        # Evict least recently used previews until the raster tier fits its budget
+        while self._raster_cache_bytes > _RASTER_CACHE_BYTES or len(self._preview_cache) > _PREVIEW_CACHE_SIZE:
+            _, evicted = self._preview_cache.popitem(last=False)
+            self._raster_cache_bytes -= evicted['bytes']
+        
+        return preview
+    
+    def _render_worker_count(self) -> int:
+        """Number of render chains to run side by side."""
+        # Compute-bound renders sharing a core only inflate each other's latency,
+        # so run one serial chain unless parallel rendering is requested
+        if self.config.get('render_concurrency', 'serial') != 'parallel':
+            return 1
+        return max(1, min(self.config.get('render_devices', 1), os.cpu_count() or 1))
+    
+    def _scene_hash(self, animation_config: Dict[str, Any]) -> bytes:
+        """Hash the animation config fields that affect rendered frame content."""
+        scene_items = sorted(
+            (key, repr(value)) for key, value in animation_config.items()
+            if key not in _RENDER_ONLY_KEYS
+        )
+        return hashlib.blake2b(repr(scene_items).encode(), digest_size=16).digest()
+    
+    def _lookup_cached_frames(self, animation_params: Dict[str, Any], quality_level: str) -> set:
+        """Return the frame numbers already rendered for this scene and quality."""
+        if not self.config.get('cache_animations', True):
+            return set()
+        
+        scene_hash = animation_params['scene_hash']
+        cached = set()
+        for frame in range(1, animation_params['total_frames'] + 1):
+            key = (scene_hash, frame, quality_level)
+            if key in self._frame_cache:
+                self._frame_cache.move_to_end(key)
+                cached.add(frame)
+        return cached
+    
+    def _store_rendered_frames(self, animation_params: Dict[str, Any], quality_level: str,
+                               cached_frames: set) -> None:
+        """Record newly rendered frames, evicting the least recently used over budget."""
+        if not self.config.get('cache_animations', True):
+            return
+        
+        scene_hash = animation_params['scene_hash']
+        resolution = animation_params['output_resolution']
+        frame_bytes = resolution['width'] * resolution['height'] * 4  # RGBA8
+        render_dir = self.config.get('temp_render_dir', 'temp_renders/')
+        budget = self.config.get('frame_cache_bytes', _FRAME_CACHE_BYTES)
+        
+        for frame in range(1, animation_params['total_frames'] + 1):
+            if frame in cached_frames:
+                continue
+            self._frame_cache[(scene_hash, frame, quality_level)] = (
+                f"{render_dir}frame_{scene_hash.hex()[:12]}_{quality_level}_{frame:05d}.png",
+                frame_bytes
+            )
+            self._frame_cache_bytes += frame_bytes
+        
+        while self._frame_cache_bytes > budget and self._frame_cache:
+            _, (_, evicted_bytes) = self._frame_cache.popitem(last=False)
+            self._frame_cache_bytes -= evicted_bytes
+    
+    def _partition_frames(self, total_frames: int, render_devices: int,
+                          tile_size: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Split frames 1..total_frames into inclusive (start, end) batches."""
+        if total_frames <= 0:
+            return []
+        
+        if tile_size is None:
+            tile_size = -(-total_frames // (render_devices * _TILES_PER_DEVICE))
+        tile_size = max(1, tile_size)
+        
+        return [(start, min(start + tile_size - 1, total_frames))
+                for start in range(1, total_frames + 1, tile_size)]
+    
     def _load_robot_model(self, robot_type: str) -> bool:
         """Load robot model into Blender scene."""
         # Simulate robot model loading
-        supported_robots = ['ABB', 'KUKA', 'FANUC', 'Universal Robots', 'Generic Robot']
+        robot_lower = robot_type.lower()
+        supported = next((name for key, name in _ROBOT_KEYS if key in robot_lower), None)
+        if supported is not None:
+            logger.info("Loaded %s robot model", supported)
+            return True
         
-        for supported in supported_robots:
-            if supported.lower() in robot_type.lower():
-                logger.info(f"Loaded {supported} robot model")
-                return True
-        
-        logger.info(f"Loaded generic robot model for {robot_type}")
+        logger.info("Loaded generic robot model for %s", robot_type)
         return True
     
     def _setup_environment(self, environment: str) -> bool:
         """Setup environment in Blender scene."""
-        environment_presets = {
-            'manufacturing_plant': {
-                'floor_material': 'concrete',
-                'walls': 'industrial_metal',
-                'machinery': True,
-                'safety_markings': True
-            },
-            'assembly_line': {
-                'conveyor_belts': True,
-                'workstations': True,
-                'overhead_lighting': True,
-                'safety_barriers': True
-            },
-            'clean_room': {
-                'sterile_surfaces': True,
-                'controlled_lighting': True,
-                'air_flow_visualization': True,
-                'contamination_protocols': True
-            },
-            'warehouse': {
-                'storage_racks': True,
-                'floor_markings': True,
-                'industrial_lighting': True,
-                'material_handling_equipment': True
-            }
-        }
-        
         # Find matching environment or use default
-        for preset_name, preset_config in environment_presets.items():
-            if preset_name.replace('_', ' ') in environment.lower():
-                logger.info(f"Setup {preset_name} environment")
-                return True
+        environment_lower = environment.lower()
+        preset_name = next((name for key, name in _ENV_KEYS if key in environment_lower), None)
+        if preset_name is not None:
+            logger.info("Setup %s environment", preset_name)
+            return True
         
-        logger.info(f"Setup default industrial environment for {environment}")
+        logger.info("Setup default industrial environment for %s", environment)
         return True
     
     def _setup_lighting(self, lighting_type: str) -> bool:
@@ -335,7 +640,7 @@ class IterativeAnimator:
         }
         
         config = lighting_configs.get(lighting_type, lighting_configs['industrial'])
-        logger.info(f"Setup {lighting_type} lighting configuration")
+        logger.info("Setup %s lighting configuration", lighting_type)
         return True
     
     def _position_cameras(self, process_type: str) -> bool:
@@ -348,7 +653,7 @@ class IterativeAnimator:
         }
         
         positions = camera_positions.get(process_type, camera_positions['assembly'])
-        logger.info(f"Positioned {len(positions)} cameras for {process_type}")
+        logger.info("Positioned %s cameras for %s", len(positions), process_type)
         return True
     
     def _load_materials(self, process_type: str) -> bool:
@@ -361,7 +666,7 @@ class IterativeAnimator:
         }
         
         materials = material_sets.get(process_type, material_sets['assembly'])
-        logger.info(f"Loaded {len(materials)} material types for {process_type}")
+        logger.info("Loaded %s material types for %s", len(materials), process_type)
         return True
     
     def _configure_timeline(self, animation_config: Dict[str, Any]) -> None:
@@ -375,7 +680,7 @@ class IterativeAnimator:
         # In reality: bpy.context.scene.frame_start = 1
         # In reality: bpy.context.scene.frame_end = total_frames
         
-        logger.info(f"Configured timeline: {total_frames} frames at {frame_rate} fps")
+        logger.info("Configured timeline: %s frames at %s fps", total_frames, frame_rate)
     
     def update_quality(self, new_quality_level: str) -> Dict[str, Any]:
         """
@@ -395,32 +700,55 @@ class IterativeAnimator:
                 return {'success': False, 'error': 'No active animation to update'}
             
             old_quality = self.current_animation['quality_level']
+            old_settings = self.current_animation['settings']
             new_settings = self.quality_presets[new_quality_level]
+            changed = {key for key in _RENDER_AFFECTING if old_settings.get(key) != new_settings.get(key)}
             
             # Update current animation
             self.current_animation['quality_level'] = new_quality_level
-            self.current_animation['settings'] = new_settings
+            self.current_animation['settings'] = _plain(new_settings)
+            self.current_animation['estimated_total_seconds'] = new_settings['render_time_estimate'] * 60.0
             self.current_animation['update_time'] = time.time()
+            self._last_progress = None
+            
+            if not changed:
+                # Frames would come out identical, so keep the running render and report it
+                animation_duration = self.current_animation['config'].get('animation_duration', 10.0)
+                logger.info("Quality %s renders like %s, keeping current render", new_quality_level, old_quality)
+                return {
+                    'success': True,
+                    'old_quality': old_quality,
+                    'new_quality': new_quality_level,
+                    'quality_improved': self._is_quality_higher(new_quality_level, old_quality),
+                    'new_settings': _plain(new_settings),
+                    'estimated_render_time': animation_duration * new_settings['render_time_estimate'],
+                    'render_result': self.current_animation['render_result']
+                }
+            
+            if 'frame_rate' in changed:
+                self._configure_timeline(self.current_animation['config'])
             
             # Reconfigure animation parameters
             animation_params = self._configure_animation_parameters(
-                self.current_animation['config'], new_settings
+                self.current_animation['config'], new_settings, self._animation_params
             )
             
             # Restart rendering with new quality
             render_result = self._start_animation_render(animation_params, new_quality_level)
+            self.current_animation['device_progress'] = dict.fromkeys(render_result['device_batches'], 0)
+            self.current_animation['render_result'] = render_result
             
             result = {
                 'success': True,
                 'old_quality': old_quality,
                 'new_quality': new_quality_level,
                 'quality_improved': self._is_quality_higher(new_quality_level, old_quality),
-                'new_settings': new_settings,
+                'new_settings': _plain(new_settings),
                 'estimated_render_time': animation_params['estimated_render_time'],
                 'render_result': render_result
             }
             
-            logger.info(f"Updated animation quality from {old_quality} to {new_quality_level}")
+            logger.info("Updated animation quality from %s to %s", old_quality, new_quality_level)
             return result
             
         except Exception as e:
@@ -429,14 +757,11 @@ class IterativeAnimator:
     
     def _is_quality_higher(self, quality1: str, quality2: str) -> bool:
         """Check if quality1 is higher than quality2."""
-        quality_order = ['low', 'medium', 'high', 'ultra']
-        
-        try:
-            index1 = quality_order.index(quality1)
-            index2 = quality_order.index(quality2)
-            return index1 > index2
-        except ValueError:
+        rank1 = _QUALITY_RANK.get(quality1)
+        rank2 = _QUALITY_RANK.get(quality2)
+        if rank1 is None or rank2 is None:
             return False
+        return rank1 > rank2
     
     def export_animation(self, export_config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -452,16 +777,25 @@ class IterativeAnimator:
             if not self.current_animation:
                 return {'export_success': False, 'error': 'No animation to export'}
             
+            now = time.time()
             output_format = export_config.get('format', 'mp4')
             quality_level = export_config.get('quality', self.current_animation['quality_level'])
-            output_path = export_config.get('output_path', f'animation_{int(time.time())}.{output_format}')
+            output_path = export_config.get('output_path', f'animation_{int(now)}.{output_format}')
             
             # Validate format
             if output_format not in self.config['output_formats']:
                 return {'export_success': False, 'error': f'Unsupported format: {output_format}'}
             
-            # Simulate export process
+            # Raw RGBA frames are streamed straight into the encoder instead of being
+            # written out as PNGs and read back
+            settings = self.quality_presets.get(quality_level, self.current_animation['settings'])
+            encoder_command = self._build_encoder_command(output_path, output_format, settings)
+            
+            # Frames are encoded here when provided; otherwise simulate the export
             # In reality: bpy.ops.render.render(animation=True)
+            frames = export_config.get('frames')
+            if frames is not None:
+                self._pipe_frames_to_encoder(self._iter_frame_buffers(frames), encoder_command)
             
             export_result = {
                 'export_success': True,
@@ -470,26 +804,75 @@ class IterativeAnimator:
                 'quality': quality_level,
                 'file_size_mb': self._estimate_file_size(quality_level),
                 'export_duration': self._estimate_export_time(quality_level),
-                'timestamp': time.time()
+                'timestamp': now,
+                'encoder_command': encoder_command
             }
             
-            logger.info(f"Exported animation to {output_path}")
+            logger.info("Exported animation to %s", output_path)
             return export_result
             
         except Exception as e:
             logger.error(f"Animation export failed: {str(e)}")
             return {'export_success': False, 'error': str(e)}
     
+    def _build_encoder_command(self, output_path: str, output_format: str,
+                               settings: Dict[str, Any]) -> List[str]:
+        """Build the ffmpeg command that encodes raw RGBA frames read from stdin."""
+        resolution = settings['resolution']
+        return [
+            'ffmpeg', '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'rgba',
+            '-s', f"{resolution['width']}x{resolution['height']}",
+            '-r', str(settings['frame_rate']),
+            '-i', '-',
+            '-c:v', _ENCODER_CODECS.get(output_format, 'libx264'),
+            '-pix_fmt', 'yuv420p',
+            output_path
+        ]
+    
+    def _iter_frame_buffers(self, frames):
+        """Yield raw frame buffers, reading any file paths into one reused buffer."""
+        buffer = bytearray()
+        for frame in frames:
+            if isinstance(frame, (bytes, bytearray, memoryview)):
+                yield frame
+                continue
+            
+            # Pre-rendered frame file: read straight into the shared buffer
+            with open(frame, 'rb', buffering=0) as frame_file:
+                size = os.fstat(frame_file.fileno()).st_size
+                if len(buffer) < size:
+                    buffer = bytearray(size)
+                view = memoryview(buffer)[:size]
+                read = 0
+                while read < size:
+                    count = frame_file.readinto(view[read:])
+                    if not count:
+                        break
+                    read += count
+                yield view[:read]
+    
+    def _pipe_frames_to_encoder(self, frames, encoder_command: List[str]) -> None:
+        """Write raw RGBA frame buffers to ffmpeg's stdin and wait for the encode."""
+        # stderr goes to a file so a chatty encoder can never block on a full pipe
+        with tempfile.TemporaryFile() as error_log:
+            process = subprocess.Popen(encoder_command, stdin=subprocess.PIPE,
+                                       stdout=subprocess.DEVNULL, stderr=error_log)
+            try:
+                for frame in frames:
+                    process.stdin.write(frame)
+            finally:
+                process.stdin.close()
+                process.wait()
+            
+            if process.returncode != 0:
+                error_log.seek(0)
+                message = error_log.read().decode(errors='replace').strip()[-200:]
+                raise RuntimeError(f"ffmpeg exited with {process.returncode}: {message}")
+    
     def _estimate_file_size(self, quality_level: str) -> float:
         """Estimate output file size in MB."""
-        size_estimates = {
-            'low': 50,
-            'medium': 200,
-            'high': 800,
-            'ultra': 2000
-        }
-        
-        return size_estimates.get(quality_level, 200)
+        return _FILE_SIZE_ESTIMATES.get(quality_level, 200)
     
     def _estimate_export_time(self, quality_level: str) -> float:
         """Estimate export time in minutes."""
@@ -507,24 +890,34 @@ class IterativeAnimator:
         if not self.current_animation:
             return {'status': 'no_animation', 'progress': 0}
         
+        # UIs poll far faster than a render advances, so reuse a recent result
+        now = time.monotonic()
+        if self._last_progress is not None and now - self._last_progress[0] < self._progress_interval:
+            return dict(self._last_progress[1])
+        
         # Simulate progress calculation
         start_time = self.current_animation['start_time']
         elapsed_time = time.time() - start_time
         
         # Estimate progress based on elapsed time (simplified)
-        estimated_total_time = self.current_animation['settings']['render_time_estimate'] * 60
+        estimated_total_time = self.current_animation['estimated_total_seconds']
         progress = min(elapsed_time / estimated_total_time * 100, 99)  # Cap at 99% until complete
         
-        return {
+        result = {
             'status': self.current_animation['status'],
             'progress': round(progress, 1),
             'quality_level': self.current_animation['quality_level'],
             'elapsed_time': elapsed_time,
             'estimated_remaining': max(0, estimated_total_time - elapsed_time)
         }
+        self._last_progress = (now, result)
+        return dict(result)
     
     def get_quality_comparison(self) -> Dict[str, Any]:
         """Get comparison of different quality levels."""
+        if self.quality_presets is _QUALITY_PRESETS:
+            return _plain(_QUALITY_COMPARISON)
+        
         comparison = {}
         
         for quality, settings in self.quality_presets.items():
@@ -540,4 +933,4 @@ class IterativeAnimator:
                 }
             }
         
-        return comparison 
\ No newline at end of file
+        return comparison
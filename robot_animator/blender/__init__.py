@@ -1,5 +1,5 @@
 """Blender integration for real-time 3D visualization and scene management."""
 
-from .scene_manager import BlenderSceneManager
+from .scene_manager import BlenderSceneManager, IKConstraintSpec, TrackConstraintSpec
 
-__all__ = ["BlenderSceneManager"] 
\ No newline at end of file
+__all__ = ["BlenderSceneManager", "IKConstraintSpec", "TrackConstraintSpec"] 
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""
+Rotation conversion kernels for keyframe preprocessing.
+
+Converts whole joint trajectories at once so callers do not loop over
+frames in Python before handing rotations to the scene manager.
+"""
+
+import numpy as np
+
+
+def quats_to_eulers(quats: np.ndarray) -> np.ndarray:
+    """
+    Convert unit quaternions to Blender 'XYZ' Euler angles.
+
+    Args:
+        quats: Quaternions in Blender's (w, x, y, z) order, shape (N, 4)
+
+    Returns:
+        Euler angles in radians, shape (N, 3)
+    """
+    quats = np.asarray(quats, dtype=np.float64).reshape(-1, 4)
+    w, x, y, z = quats[:, 0], quats[:, 1], quats[:, 2], quats[:, 3]
+    eulers = np.empty((quats.shape[0], 3), dtype=np.float64)
+    eulers[:, 0] = np.arctan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y))
+    eulers[:, 1] = np.arcsin(np.clip(2.0 * (w * y - z * x), -1.0, 1.0))
+    eulers[:, 2] = np.arctan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z))
+    return eulers
@@ -6,8 +6,17 @@ and manipulating 3D scenes, armatures, and animation constraints.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple, Union
 import json
+import weakref
+from types import MappingProxyType
+
+import numpy as np
+
+from ._rot_kernels import quats_to_eulers
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +29,123 @@ except ImportError:
     BLENDER_AVAILABLE = False
     logger.warning("Blender not available - using mock implementation")
 
+# bpy.data.objects, bound on first use instead of re-resolved on every lookup.
+# Blender restricts bpy.data while add-ons register and replaces it on file
+# load, so the reference is resolved lazily and dropped after every load.
+_data_objects = None
+
+
+def _objects():
+    """Return bpy.data.objects, binding it on first use."""
+    global _data_objects
+    if _data_objects is None:
+        _data_objects = bpy.data.objects
+    return _data_objects
+
+
+def _reset_bpy_refs(*_args):
+    """load_post handler: drop references into the previous file's data."""
+    global _data_objects
+    _data_objects = None
+
+
+# Managers whose cached scene info the depsgraph handler invalidates
+_live_managers = weakref.WeakSet()
+
+
+def _on_depsgraph_update(scene, depsgraph=None):
+    """depsgraph_update_post handler: invalidate cached scene info on scene changes."""
+    # Object edits fire on nearly every tick and do not affect the cached
+    # fields; only scene settings such as the frame range do
+    if depsgraph is not None and not depsgraph.id_type_updated('SCENE'):
+        return
+    for manager in _live_managers:
+        manager._scene_info_dirty = True
+
+
+def _module_handlers():
+    """(handler list, handler) pairs owned by this module."""
+    return (
+        (bpy.app.handlers.load_post, _reset_bpy_refs),
+        (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update),
+    )
+
+
+def _install_handlers():
+    """Register the module's bpy.app handlers, once per import of this module."""
+    for handlers, handler in _module_handlers():
+        if handler in handlers:
+            continue
+        
+        # Drop a handler left behind by a previous import of this module (add-on reload)
+        for stale in list(handlers):
+            if getattr(stale, '__name__', None) == handler.__name__ and \
+                    getattr(stale, '__module__', None) == __name__:
+                handlers.remove(stale)
+        handlers.append(bpy.app.handlers.persistent(handler))
+
+
+def remove_handlers():
+    """Remove the module's bpy.app handlers; called from the add-on's unregister()."""
+    if not BLENDER_AVAILABLE:
+        return
+    
+    for handlers, handler in _module_handlers():
+        if handler in handlers:
+            handlers.remove(handler)
+
+# Index of 'BEZIER' in the keyframe interpolation enum, as written by foreach_set
+_BEZIER_INTERPOLATION = 2
+
+# Length of each generated joint bone, in metres
+_BONE_LENGTH = 0.2
+
+# Armature data-blocks kept for reuse by joint layout, most recently used last
+_ARMATURE_TEMPLATE_CACHE_SIZE = 32
+
+# Exporter options that skip subsystems a robot animation does not use
+_GLTF_EXPORT_KWARGS = MappingProxyType({
+    'export_materials': 'NONE',
+    'export_morph': False,
+    'export_skins': True,
+    'export_cameras': False,
+    'export_lights': False,
+    'use_active_scene': True
+})
+_FBX_EXPORT_KWARGS = MappingProxyType({
+    'bake_anim': True,
+    'use_mesh_modifiers': False,
+    'add_leaf_bones': False
+})
+
+
+@dataclass(frozen=True)
+class IKConstraintSpec:
+    """IK constraint on a bone, optionally aimed at a target object."""
+    bone: str
+    target: Optional[str] = None
+    chain_length: int = 0
+    
+    @classmethod
+    def from_dict(cls, constraint_data: Dict[str, Any]) -> 'IKConstraintSpec':
+        return cls(constraint_data["bone"], constraint_data.get("target"),
+                   constraint_data.get("chain_length", 0))
+
+
+@dataclass(frozen=True)
+class TrackConstraintSpec:
+    """Track-to constraint on a bone, optionally aimed at a target object."""
+    bone: str
+    target: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, constraint_data: Dict[str, Any]) -> 'TrackConstraintSpec':
+        return cls(constraint_data["bone"], constraint_data.get("target"))
+
+
+# Constraint spec class for each constraint_data "type"
+_CONSTRAINT_SPEC_TYPES = {'IK': IKConstraintSpec, 'TRACK_TO': TrackConstraintSpec}
+
 
 class BlenderSceneManager:
     """
@@ -30,63 +156,46 @@ class BlenderSceneManager:
     - Insert keyframes into the timeline
     - Apply constraints (IK, tracking, etc.)
     - Export animations and scenes
+    
+    Instantiating it returns the bpy-backed implementation inside Blender
+    and the mock implementation elsewhere, so no method re-checks
+    BLENDER_AVAILABLE per call.
     """
     
+    def __new__(cls, *args, **kwargs):
+        if cls is BlenderSceneManager:
+            cls = _RealBlenderSceneManager if BLENDER_AVAILABLE else _MockBlenderSceneManager
+        return super().__new__(cls)
+    
     def __init__(self):
         """Initialize the Blender scene manager."""
         self.constraint_applied = False
-        self.current_armature = None
-        self.scene_objects = {}
+        self.current_armature = None  # bpy armature object; always None in the mock
+        self.current_armature_name = None
         
-        if BLENDER_AVAILABLE:
-            self.context = bpy.context
-            self.data = bpy.data
-            self.ops = bpy.ops
-        else:
-            # Mock objects for testing
-            self._setup_mock_blender()
-    
-    def _setup_mock_blender(self):
-        """Setup mock Blender objects for testing."""
-        class MockOps:
-            class object:
-                @staticmethod
-                def armature_add():
-                    pass
-                
-                @staticmethod
-                def mode_set(mode='OBJECT'):
-                    pass
-            
-            class anim:
-                @staticmethod
-                def keyframe_insert():
-                    pass
-                
-                @staticmethod
-                def keyframe_clear_v3d():
-                    pass
-            
-            class pose:
-                @staticmethod
-                def select_all(action='SELECT'):
-                    pass
+        # Managed scene objects as parallel lists indexed through _name_to_idx
+        self._names = []
+        self._handles = []
+        self._name_to_idx = {}
         
-        class MockContext:
-            def __init__(self):
-                self.object = None
-                self.scene = MockScene()
+        # Name -> bpy handle caches for the armature's pose bones and target objects
+        self._pose_bone_cache = {}
+        self._target_cache = {}
         
-        class MockScene:
-            def __init__(self):
-                self.frame_current = 1
-            
-            def frame_set(self, frame):
-                self.frame_current = frame
+        # Unused copies of built armature data keyed by joint names tuple, oldest first
+        self._armature_template_cache = OrderedDict()
         
-        self.ops = MockOps()
-        self.context = MockContext()
-        self.data = {}
+        # Data-blocks (actions, armature data) created here and removed by clear_scene
+        self._owned_data = []
+        
+        # Keyframes waiting for flush_keyframes, as bone name -> [(frame, rotation)]
+        self._pending_keyframes = {}
+        
+        # get_scene_info result, rebuilt only after the scene changed
+        self._scene_info = None
+        self._scene_info_dirty = True
+        
+        self._setup_backend()
     
     def create_armature(self, armature_name: str, joint_names: Optional[List[str]] = None) -> bool:
         """
@@ -95,127 +204,184 @@ class BlenderSceneManager:
         Args:
             armature_name: Name for the armature object
             joint_names: List of joint/bone names to create
-            
+        
         Returns:
             bool: True if armature was created successfully
         """
         try:
-            if BLENDER_AVAILABLE:
-                # Clear existing selection
-                bpy.ops.object.select_all(action='DESELECT')
-                
-                # Add armature
-                bpy.ops.object.armature_add(enter_editmode=True)
-                armature_obj = bpy.context.active_object
-                armature_obj.name = armature_name
-                
-                # Get the armature data
-                armature_data = armature_obj.data
-                armature_data.name = f"{armature_name}_Data"
-                
-                if joint_names:
-                    self._create_bone_hierarchy(armature_data, joint_names)
-                
-                # Switch back to object mode
-                bpy.ops.object.mode_set(mode='OBJECT')
-                
-                self.current_armature = armature_obj
-                self.scene_objects[armature_name] = armature_obj
-                
-            else:
-                # Mock implementation
-                self.ops.object.armature_add()
-                self.current_armature = armature_name
-                self.scene_objects[armature_name] = armature_name
+            self._create_armature(armature_name, joint_names)
             
-            logger.info(f"Created armature: {armature_name}")
+            self._scene_info_dirty = True
+            logger.info("Created armature: %s", armature_name)
             return True
-            
+        
         except Exception as e:
-            logger.error(f"Failed to create armature {armature_name}: {e}")
+            logger.error("Failed to create armature %s: %s", armature_name, e)
             return False
     
-    def _create_bone_hierarchy(self, armature_data, joint_names: List[str]):
-        """Create a hierarchy of bones for the robot joints."""
-        if not BLENDER_AVAILABLE:
-            return
+    @property
+    def scene_objects(self) -> Dict[str, Any]:
+        """Managed objects as a name -> handle dict (a fresh copy)."""
+        return dict(zip(self._names, self._handles))
+    
+    def _add_scene_object(self, name: str, handle):
+        """Record a managed object, replacing any earlier object of the same name."""
+        index = self._name_to_idx.get(name)
+        if index is None:
+            self._name_to_idx[name] = len(self._names)
+            self._names.append(name)
+            self._handles.append(handle)
+        else:
+            self._handles[index] = handle
+    
+    def insert_keyframe(self, keyframe_data: Dict[str, Any]) -> bool:
+        """
+        Insert a keyframe into the Blender timeline.
         
-        # Remove default bone
-        if armature_data.edit_bones:
-            armature_data.edit_bones.remove(armature_data.edit_bones[0])
+        Args:
+            keyframe_data: Dictionary containing keyframe information
         
-        # Create bones for each joint
-        previous_bone = None
-        for i, joint_name in enumerate(joint_names):
-            bone = armature_data.edit_bones.new(joint_name)
+        Returns:
+            bool: True if keyframe was inserted successfully
+        """
+        return self.insert_keyframe_batch([keyframe_data])
+    
+    def insert_keyframe_batch(self, items: List[Dict[str, Any]]) -> bool:
+        """
+        Insert several keyframes, entering pose mode only once.
+        
+        Args:
+            items: Keyframe dictionaries as accepted by insert_keyframe
+        
+        Returns:
+            bool: True if all keyframes were inserted successfully
+        """
+        try:
+            if not items:
+                return True
             
-            # Position bones in a chain
-            if previous_bone:
-                bone.head = previous_bone.tail
-                bone.parent = previous_bone
-            else:
-                bone.head = (0, 0, 0)
+            if not self._insert_keyframe_items(items):
+                return False
+            
+            self._scene_info_dirty = True
+            return True
+        
+        except Exception as e:
+            logger.error("Failed to insert keyframe: %s", e)
+            return False
+    
+    def insert_keyframes(self, bone_name: str, frames: np.ndarray, eulers: np.ndarray) -> bool:
+        """
+        Insert a whole rotation trajectory for one bone in a single pass.
+        
+        Writes the rotation_euler fcurves directly instead of inserting
+        one keyframe at a time.
+        
+        Args:
+            bone_name: Name of the pose bone to animate
+            frames: Frame numbers, shape (N,)
+            eulers: Euler rotations per frame, shape (N, 3)
+        
+        Returns:
+            bool: True if keyframes were inserted successfully
+        """
+        try:
+            frames = np.asarray(frames, dtype=np.float32).reshape(-1)
+            eulers = np.asarray(eulers, dtype=np.float32).reshape(-1, 3)
+            if len(frames) != len(eulers):
+                logger.warning("Got %d frames but %d rotations for %s", len(frames), len(eulers), bone_name)
+                return False
             
-            # Set tail position (length of bone)
-            bone.tail = (bone.head[0], bone.head[1], bone.head[2] + 0.2)
+            if len(frames) == 0:
+                return True
             
-            previous_bone = bone
+            return self._write_rotation_keyframes(bone_name, frames, eulers)
+        
+        except Exception as e:
+            logger.error("Failed to insert keyframes for %s: %s", bone_name, e)
+            return False
     
-    def insert_keyframe(self, keyframe_data: Dict[str, Any]) -> bool:
+    def insert_keyframes_from_quats(self, bone_name: str, frames: np.ndarray, quats: np.ndarray) -> bool:
         """
-        Insert a keyframe into the Blender timeline.
+        Insert a rotation trajectory given as (w, x, y, z) quaternions.
         
         Args:
-            keyframe_data: Dictionary containing keyframe information
+            bone_name: Name of the pose bone to animate
+            frames: Frame numbers, shape (N,)
+            quats: Unit quaternions per frame, shape (N, 4)
+        
+        Returns:
+            bool: True if keyframes were inserted successfully
+        """
+        try:
+            eulers = quats_to_eulers(quats)
+        except Exception as e:
+            logger.error("Failed to convert quaternions for %s: %s", bone_name, e)
+            return False
+        return self.insert_keyframes(bone_name, frames, eulers)
+    
+    def build_action_from_trajectory(self, name: str, bone_name: str,
+                                     frames: np.ndarray, eulers: np.ndarray) -> bool:
+        """
+        Build a standalone action for one bone trajectory and add it as an NLA strip.
+        
+        Unlike insert_keyframes, the armature's active action is left untouched;
+        the motion lives in its own action, starting at the first frame.
+        
+        Args:
+            name: Name for the action and its strip
+            bone_name: Name of the pose bone to animate
+            frames: Frame numbers, shape (N,)
+            eulers: Euler rotations per frame, shape (N, 3)
             
         Returns:
-            bool: True if keyframe was inserted successfully
+            bool: True if the strip was added successfully
         """
         try:
-            bone_name = keyframe_data["bone"]
-            frame = keyframe_data["frame"]
-            rotation = keyframe_data["rotation"]
+            frames = np.asarray(frames, dtype=np.float32).reshape(-1)
+            eulers = np.asarray(eulers, dtype=np.float32).reshape(-1, 3)
+            if len(frames) == 0 or len(frames) != len(eulers):
+                logger.warning("Need matching, non-empty frames and rotations for %s", name)
+                return False
             
-            if BLENDER_AVAILABLE:
-                # Set current frame
-                bpy.context.scene.frame_set(frame)
-                
-                # Get the armature and switch to pose mode
-                if self.current_armature:
-                    bpy.context.view_layer.objects.active = self.current_armature
-                    bpy.ops.object.mode_set(mode='POSE')
-                    
-                    # Get the pose bone
-                    pose_bone = self.current_armature.pose.bones.get(bone_name)
-                    if pose_bone:
-                        # Set rotation
-                        pose_bone.rotation_euler = rotation
-                        
-                        # Insert keyframe
-                        pose_bone.keyframe_insert(data_path="rotation_euler")
-                        
-                        logger.debug(f"Inserted keyframe for {bone_name} at frame {frame}")
-                    else:
-                        logger.warning(f"Bone {bone_name} not found in armature")
-                        return False
-            else:
-                # Mock implementation
-                self.context.scene.frame_set(frame)
-                self.ops.anim.keyframe_insert()
+            if not self._push_trajectory_strip(name, bone_name, frames, eulers):
+                return False
             
+            self._scene_info_dirty = True
+            logger.info("Added %s strip for %s", name, bone_name)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to insert keyframe: {e}")
+            logger.error("Failed to build action %s: %s", name, e)
             return False
     
+    def enqueue_keyframe(self, bone_name: str, frame: int, rotation: Tuple[float, float, float]):
+        """Queue a bone rotation keyframe for the next flush_keyframes call."""
+        self._pending_keyframes.setdefault(bone_name, []).append((frame, rotation))
+    
+    def flush_keyframes(self) -> bool:
+        """
+        Write all queued keyframes, one bulk fcurve write per bone.
+        
+        Returns:
+            bool: True if every bone's keyframes were inserted successfully
+        """
+        pending, self._pending_keyframes = self._pending_keyframes, {}
+        
+        success = True
+        for bone_name, samples in pending.items():
+            frames = np.array([frame for frame, _ in samples], dtype=np.float32)
+            eulers = np.array([rotation for _, rotation in samples], dtype=np.float32)
+            success = self.insert_keyframes(bone_name, frames, eulers) and success
+        return success
+    
     def apply_constraint(self, constraint_data: Dict[str, Any]) -> bool:
         """
         Apply a constraint to a bone.
         
         Args:
             constraint_data: Dictionary containing constraint information
-            
+        
         Returns:
             bool: True if constraint was applied successfully
         """
@@ -223,75 +389,41 @@ class BlenderSceneManager:
             bone_name = constraint_data["bone"]
             constraint_type = constraint_data["type"]
             
-            if BLENDER_AVAILABLE:
-                if self.current_armature:
-                    bpy.context.view_layer.objects.active = self.current_armature
-                    bpy.ops.object.mode_set(mode='POSE')
-                    
-                    pose_bone = self.current_armature.pose.bones.get(bone_name)
-                    if pose_bone:
-                        if constraint_type == "IK":
-                            self._apply_ik_constraint(pose_bone, constraint_data)
-                        elif constraint_type == "TRACK_TO":
-                            self._apply_track_constraint(pose_bone, constraint_data)
-                        else:
-                            logger.warning(f"Unknown constraint type: {constraint_type}")
-                            return False
-                    else:
-                        logger.warning(f"Bone {bone_name} not found")
-                        return False
+            if not self._apply_constraint_data(constraint_type, constraint_data):
+                return False
             
             self.constraint_applied = True
-            logger.info(f"Applied {constraint_type} constraint to {bone_name}")
+            self._scene_info_dirty = True
+            logger.info("Applied %s constraint to %s", constraint_type, bone_name)
             return True
-            
+        
         except Exception as e:
-            logger.error(f"Failed to apply constraint: {e}")
+            logger.error("Failed to apply constraint: %s", e)
             return False
     
-    def _apply_ik_constraint(self, pose_bone, constraint_data: Dict[str, Any]):
-        """Apply an IK constraint to a pose bone."""
-        if not BLENDER_AVAILABLE:
-            return
-        
-        # Create IK constraint
-        ik_constraint = pose_bone.constraints.new(type='IK')
-        ik_constraint.name = f"IK_{pose_bone.name}"
-        
-        # Set target if specified
-        if "target" in constraint_data:
-            target_name = constraint_data["target"]
-            target_obj = bpy.data.objects.get(target_name)
-            if target_obj:
-                ik_constraint.target = target_obj
-        
-        # Set chain length if specified
-        if "chain_length" in constraint_data:
-            ik_constraint.chain_count = constraint_data["chain_length"]
-        
-        # Set other IK properties
-        ik_constraint.use_tail = True
-        ik_constraint.use_stretch = False
-    
-    def _apply_track_constraint(self, pose_bone, constraint_data: Dict[str, Any]):
-        """Apply a track-to constraint to a pose bone."""
-        if not BLENDER_AVAILABLE:
-            return
+    def apply_constraints(self, specs: List[Union[IKConstraintSpec, TrackConstraintSpec]]) -> bool:
+        """
+        Apply several constraints in one call.
         
-        # Create track-to constraint
-        track_constraint = pose_bone.constraints.new(type='TRACK_TO')
-        track_constraint.name = f"Track_{pose_bone.name}"
+        Args:
+            specs: Constraint specs, each naming the bone it applies to
         
-        # Set target if specified
-        if "target" in constraint_data:
-            target_name = constraint_data["target"]
-            target_obj = bpy.data.objects.get(target_name)
-            if target_obj:
-                track_constraint.target = target_obj
+        Returns:
+            bool: True if all constraints were applied successfully
+        """
+        try:
+            if not self._apply_constraint_specs(specs):
+                return False
+            
+            if specs:
+                self.constraint_applied = True
+                self._scene_info_dirty = True
+            logger.info("Applied %d constraints", len(specs))
+            return True
         
-        # Set tracking axis
-        track_constraint.track_axis = 'TRACK_Y'
-        track_constraint.up_axis = 'UP_Z'
+        except Exception as e:
+            logger.error("Failed to apply constraints: %s", e)
+            return False
     
     def create_target_empty(self, name: str, location: Tuple[float, float, float]) -> bool:
         """
@@ -300,29 +432,21 @@ class BlenderSceneManager:
         Args:
             name: Name for the empty object
             location: 3D location for the empty
-            
+        
         Returns:
             bool: True if empty was created successfully
         """
         try:
-            if BLENDER_AVAILABLE:
-                bpy.ops.object.empty_add(type='PLAIN_AXES', location=location)
-                empty_obj = bpy.context.active_object
-                empty_obj.name = name
-                
-                self.scene_objects[name] = empty_obj
-                logger.info(f"Created target empty: {name} at {location}")
-            else:
-                # Mock implementation
-                self.scene_objects[name] = {"location": location}
+            self._create_target_empty(name, location)
             
+            self._scene_info_dirty = True
             return True
-            
+        
         except Exception as e:
-            logger.error(f"Failed to create target empty {name}: {e}")
+            logger.error("Failed to create target empty %s: %s", name, e)
             return False
     
-    def animate_to_target(self, target_name: str, target_position: Tuple[float, float, float], 
+    def animate_to_target(self, target_name: str, target_position: Tuple[float, float, float],
                          duration_frames: int = 50) -> bool:
         """
         Animate a target object to a new position.
@@ -331,35 +455,15 @@ class BlenderSceneManager:
             target_name: Name of the target object
             target_position: New position for the target
             duration_frames: Number of frames for the animation
-            
+        
         Returns:
             bool: True if animation was created successfully
         """
         try:
-            if BLENDER_AVAILABLE:
-                target_obj = bpy.data.objects.get(target_name)
-                if not target_obj:
-                    logger.warning(f"Target object {target_name} not found")
-                    return False
-                
-                # Set keyframe at current frame
-                current_frame = bpy.context.scene.frame_current
-                target_obj.keyframe_insert(data_path="location")
-                
-                # Move to end frame and set new position
-                bpy.context.scene.frame_set(current_frame + duration_frames)
-                target_obj.location = target_position
-                target_obj.keyframe_insert(data_path="location")
-                
-                # Return to original frame
-                bpy.context.scene.frame_set(current_frame)
-                
-                logger.info(f"Animated {target_name} to {target_position}")
-            
-            return True
-            
+            return self._animate_to_target(target_name, target_position, duration_frames)
+        
         except Exception as e:
-            logger.error(f"Failed to animate target {target_name}: {e}")
+            logger.error("Failed to animate target %s: %s", target_name, e)
             return False
     
     def export_animation(self, filepath: str, format: str = "FBX") -> bool:
@@ -369,30 +473,15 @@ class BlenderSceneManager:
         Args:
             filepath: Path to save the animation file
             format: Export format ("FBX", "GLTF", "BLEND")
-            
+        
         Returns:
             bool: True if export was successful
         """
         try:
-            if not BLENDER_AVAILABLE:
-                logger.info(f"Mock export to {filepath} in {format} format")
-                return True
-            
-            if format.upper() == "FBX":
-                bpy.ops.export_scene.fbx(filepath=filepath)
-            elif format.upper() == "GLTF":
-                bpy.ops.export_scene.gltf(filepath=filepath)
-            elif format.upper() == "BLEND":
-                bpy.ops.wm.save_as_mainfile(filepath=filepath)
-            else:
-                logger.error(f"Unsupported export format: {format}")
-                return False
-            
-            logger.info(f"Exported animation to {filepath}")
-            return True
-            
+            return self._export_animation(filepath, format)
+        
         except Exception as e:
-            logger.error(f"Failed to export animation: {e}")
+            logger.error("Failed to export animation: %s", e)
             return False
     
     def clear_scene(self) -> bool:
@@ -403,26 +492,25 @@ class BlenderSceneManager:
             bool: True if scene was cleared successfully
         """
         try:
-            if BLENDER_AVAILABLE:
-                # Select all objects
-                bpy.ops.object.select_all(action='SELECT')
-                
-                # Delete all selected objects
-                bpy.ops.object.delete(use_global=False)
-                
-                # Clear orphaned data
-                bpy.ops.outliner.orphans_purge()
+            self._clear_scene_data()
             
             # Reset internal state
             self.current_armature = None
-            self.scene_objects.clear()
+            self.current_armature_name = None
+            self._names.clear()
+            self._handles.clear()
+            self._name_to_idx.clear()
+            self._pending_keyframes.clear()
+            self._pose_bone_cache.clear()
+            self._target_cache.clear()
             self.constraint_applied = False
+            self._scene_info_dirty = True
             
             logger.info("Cleared Blender scene")
             return True
-            
+        
         except Exception as e:
-            logger.error(f"Failed to clear scene: {e}")
+            logger.error("Failed to clear scene: %s", e)
             return False
     
     def get_scene_info(self) -> Dict[str, Any]:
@@ -432,26 +520,573 @@ class BlenderSceneManager:
         Returns:
             Dictionary containing scene information
         """
-        # Handle current_armature being either a string or an object with .name
-        armature_name = None
-        if self.current_armature:
-            if hasattr(self.current_armature, 'name'):
-                armature_name = self.current_armature.name
-            else:
-                armature_name = str(self.current_armature)
+        if self._scene_info_dirty or self._scene_info is None:
+            self._scene_info = self._build_scene_info()
+            self._scene_info_dirty = False
         
-        info = {
-            "objects": list(self.scene_objects.keys()),
-            "current_armature": armature_name,
+        info = dict(self._scene_info)
+        info["objects"] = list(info["objects"])
+        return info
+    
+    def _build_scene_info(self) -> Dict[str, Any]:
+        """Collect the scene information cached by get_scene_info."""
+        return {
+            "objects": list(self._names),
+            "current_armature": self.current_armature_name,
             "constraints_applied": self.constraint_applied
         }
+
+
+class _RealBlenderSceneManager(BlenderSceneManager):
+    """BlenderSceneManager backed by the live bpy API."""
+    
+    def _setup_backend(self):
+        self.context = bpy.context
+        self.data = bpy.data
+        self.ops = bpy.ops
+        _install_handlers()
+        _live_managers.add(self)
+    
+    def _create_armature(self, armature_name: str, joint_names: Optional[List[str]]):
+        template = self._get_armature_template(joint_names)
+        if template is not None:
+            # Same joint layout as before: copy the built bones instead of rebuilding
+            armature_obj = self._link_armature(armature_name, template)
+        else:
+            armature_obj = self._build_armature(armature_name, joint_names)
+        
+        # Pose bones are rebuilt on leaving edit mode, so index them now
+        self._pose_bone_cache = {bone.name: bone for bone in armature_obj.pose.bones}
+        
+        self.current_armature = armature_obj
+        self.current_armature_name = armature_obj.name
+        self._add_scene_object(armature_name, armature_obj)
+    
+    def _build_armature(self, armature_name: str, joint_names: Optional[List[str]]):
+        """Add a new armature object and build its bones in edit mode."""
+        # Clear existing selection
+        bpy.ops.object.select_all(action='DESELECT')
+        
+        # Add armature
+        bpy.ops.object.armature_add(enter_editmode=True)
+        armature_obj = bpy.context.active_object
+        armature_obj.name = armature_name
+        
+        # Get the armature data
+        armature_data = armature_obj.data
+        armature_data.name = f"{armature_name}_Data"
+        
+        if joint_names:
+            self._create_bone_hierarchy(armature_data, joint_names)
+        
+        # Switch back to object mode
+        bpy.ops.object.mode_set(mode='OBJECT')
+        
+        self._owned_data.append(armature_data)
+        if joint_names:
+            self._store_armature_template(joint_names, armature_data.copy())
+        return armature_obj
+    
+    def _link_armature(self, armature_name: str, template):
+        """Add a new armature object with its own copy of template's armature data."""
+        armature_data = template.copy()
+        armature_data.name = f"{armature_name}_Data"
+        self._owned_data.append(armature_data)
+        
+        armature_obj = bpy.data.objects.new(armature_name, armature_data)
+        bpy.context.collection.objects.link(armature_obj)
+        
+        for obj in bpy.context.selected_objects:
+            obj.select_set(False)
+        armature_obj.select_set(True)
+        bpy.context.view_layer.objects.active = armature_obj
+        
+        # Evaluate once so the new object gets its pose
+        bpy.context.view_layer.update()
+        return armature_obj
+    
+    def _get_armature_template(self, joint_names: Optional[List[str]]):
+        """Return cached armature data built for joint_names, or None."""
+        if not joint_names:
+            return None
+        
+        key = tuple(joint_names)
+        armature_data = self._armature_template_cache.get(key)
+        if armature_data is None:
+            return None
+        
+        try:
+            armature_data.name
+        except ReferenceError:
+            # Removed outside this manager
+            del self._armature_template_cache[key]
+            return None
+        
+        self._armature_template_cache.move_to_end(key)
+        return armature_data
+    
+    def _store_armature_template(self, joint_names: List[str], armature_data):
+        """Remember armature data for reuse, evicting the least recently used entry."""
+        # Templates have no users, so they are never saved with the file
+        self._armature_template_cache[tuple(joint_names)] = armature_data
+        
+        while len(self._armature_template_cache) > _ARMATURE_TEMPLATE_CACHE_SIZE:
+            _, evicted = self._armature_template_cache.popitem(last=False)
+            try:
+                bpy.data.armatures.remove(evicted)
+            except ReferenceError:
+                pass
+    
+    def _create_bone_hierarchy(self, armature_data, joint_names: List[str]):
+        """Create a hierarchy of bones for the robot joints."""
+        # Remove default bone
+        if armature_data.edit_bones:
+            armature_data.edit_bones.remove(armature_data.edit_bones[0])
+        
+        # Chain every bone straight up the Z axis, each starting at its parent's tail
+        heads = np.zeros((len(joint_names), 3))
+        heads[:, 2] = np.arange(len(joint_names)) * _BONE_LENGTH
+        tails = heads + (0.0, 0.0, _BONE_LENGTH)
+        
+        # Create bones for each joint, then write positions and parents in separate
+        # passes; EditBones have no foreach_set, so keep the per-bone work to plain writes
+        new_bone = armature_data.edit_bones.new
+        bones = [new_bone(joint_name) for joint_name in joint_names]
+        for bone, head, tail in zip(bones, heads.tolist(), tails.tolist()):
+            bone.head = head
+            bone.tail = tail
+        for parent, bone in zip(bones, bones[1:]):
+            bone.parent = parent
+    
+    def _get_pose_bone(self, bone_name: str):
+        """Return the current armature's pose bone by name, or None."""
+        pose_bone = self._pose_bone_cache.get(bone_name)
+        if pose_bone is not None:
+            try:
+                pose_bone.name
+                return pose_bone
+            except ReferenceError:
+                # The armature was rebuilt behind our back; fall back to a fresh lookup
+                self._pose_bone_cache.pop(bone_name, None)
+        
+        pose_bone = self.current_armature.pose.bones.get(bone_name)
+        if pose_bone is not None:
+            self._pose_bone_cache[bone_name] = pose_bone
+        return pose_bone
+    
+    def _get_target(self, target_name: str):
+        """Return a target object by name, or None."""
+        target_obj = self._target_cache.get(target_name)
+        if target_obj is not None:
+            try:
+                target_obj.name
+                return target_obj
+            except ReferenceError:
+                self._target_cache.pop(target_name, None)
+        
+        target_obj = _objects().get(target_name)
+        if target_obj is not None:
+            self._target_cache[target_name] = target_obj
+        return target_obj
+    
+    @contextmanager
+    def _pose_session(self):
+        """Put the current armature in pose mode for the duration of the block."""
+        armature = self.current_armature
+        if hasattr(bpy.context, 'temp_override'):
+            override = bpy.context.temp_override(active_object=armature, object=armature)
+        else:
+            # Blender < 3.2 has no temp_override; make the armature active instead
+            bpy.context.view_layer.objects.active = armature
+            override = nullcontext()
+        
+        with override:
+            if armature.mode != 'POSE':
+                bpy.ops.object.mode_set(mode='POSE')
+            yield
+    
+    def _insert_keyframe_items(self, items: List[Dict[str, Any]]) -> bool:
+        if not self.current_armature:
+            return True
+        
+        # Keys are inserted at explicit frames and the scene's current frame is left
+        # alone: each frame_set re-evaluates the whole depsgraph
+        insert_pose_keyframe = self._insert_pose_keyframe
+        with self._pose_session():
+            for keyframe_data in items:
+                if not insert_pose_keyframe(keyframe_data):
+                    return False
+        return True
+    
+    def _insert_pose_keyframe(self, keyframe_data: Dict[str, Any]) -> bool:
+        """Key one bone rotation; the caller holds the pose session."""
+        bone_name = keyframe_data["bone"]
+        frame = keyframe_data["frame"]
+        
+        # Get the pose bone
+        pose_bone = self._get_pose_bone(bone_name)
+        if pose_bone:
+            # Set rotation
+            pose_bone.rotation_euler = keyframe_data["rotation"]
+            
+            # Key at the given frame; the scene's current frame does not need to match
+            pose_bone.keyframe_insert(data_path="rotation_euler", frame=frame)
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Inserted keyframe for %s at frame %s", bone_name, frame)
+            return True
+        
+        logger.warning("Bone %s not found in armature", bone_name)
+        return False
+    
+    def _get_action(self, obj):
+        """Return the object's action, creating animation data and action as needed."""
+        animation_data = obj.animation_data_create()
+        action = animation_data.action
+        if action is None:
+            action = bpy.data.actions.new(f"{obj.name}Action")
+            animation_data.action = action
+            self._owned_data.append(action)
+        return action
+    
+    def _append_fcurve_points(self, action, data_path: str, index: int,
+                              frames: np.ndarray, values: np.ndarray, group: Optional[str] = None):
+        """Add (frame, value) keyframes to one fcurve channel in a single bulk write."""
+        fcurve = action.fcurves.find(data_path, index=index)
+        if fcurve is None:
+            if group:
+                fcurve = action.fcurves.new(data_path, index=index, action_group=group)
+            else:
+                fcurve = action.fcurves.new(data_path, index=index)
+        
+        # Keep only the last sample for a frame repeated within the batch
+        reversed_frames = frames[::-1]
+        _, last = np.unique(reversed_frames, return_index=True)
+        frames = reversed_frames[last]
+        values = values[::-1][last]
+        
+        points = fcurve.keyframe_points
+        existing = len(points)
+        co = np.empty(2 * existing, dtype=np.float32)
+        interpolation = np.empty(existing, dtype=np.int32)
+        
+        # Frames that already have a key are overwritten in place, as keyframe_insert
+        # would; the rest are appended
+        replaced = np.zeros(len(frames), dtype=bool)
+        if existing:
+            points.foreach_get("co", co)
+            points.foreach_get("interpolation", interpolation)
+            existing_frames = co[0::2]
+            order = np.argsort(existing_frames, kind='stable')
+            matches = order[np.searchsorted(existing_frames, frames, sorter=order).clip(max=existing - 1)]
+            replaced = existing_frames[matches] == frames
+            co[2 * matches[replaced] + 1] = values[replaced]
+        
+        new_frames = frames[~replaced]
+        count = len(new_frames)
+        if count:
+            points.add(count)
+        
+        # foreach_set writes every point, so carry over the existing ones
+        co = np.concatenate((co, np.empty(2 * count, dtype=np.float32)))
+        co[2 * existing::2] = new_frames
+        co[2 * existing + 1::2] = values[~replaced]
+        interpolation = np.concatenate((interpolation, np.full(count, _BEZIER_INTERPOLATION, dtype=np.int32)))
+        points.foreach_set("co", co)
+        points.foreach_set("interpolation", interpolation)
+        fcurve.update()
+    
+    def _write_rotation_keyframes(self, bone_name: str, frames: np.ndarray, eulers: np.ndarray) -> bool:
+        if not self.current_armature:
+            logger.warning("No armature to insert keyframes into")
+            return False
+        if self._get_pose_bone(bone_name) is None:
+            logger.warning("Bone %s not found in armature", bone_name)
+            return False
+        
+        action = self._get_action(self.current_armature)
+        
+        data_path = f'pose.bones["{bone_name}"].rotation_euler'
+        for index in range(3):
+            self._append_fcurve_points(action, data_path, index, frames, eulers[:, index], bone_name)
+        
+        logger.debug("Inserted %d keyframes for %s", len(frames), bone_name)
+        return True
+    
+    def _push_trajectory_strip(self, name: str, bone_name: str,
+                               frames: np.ndarray, eulers: np.ndarray) -> bool:
+        if not self.current_armature:
+            logger.warning("No armature to add the strip to")
+            return False
+        
+        # The action is filled on its own, without being assigned to the armature
+        action = bpy.data.actions.new(name)
+        self._owned_data.append(action)
+        data_path = f'pose.bones["{bone_name}"].rotation_euler'
+        for index in range(3):
+            self._append_fcurve_points(action, data_path, index, frames, eulers[:, index], bone_name)
+        
+        animation_data = self.current_armature.animation_data_create()
+        track = animation_data.nla_tracks.new()
+        track.name = name
+        track.strips.new(name, int(frames.min()), action)
+        return True
+    
+    def _apply_constraint_data(self, constraint_type: str, constraint_data: Dict[str, Any]) -> bool:
+        if not self.current_armature:
+            return True
+        
+        spec_type = _CONSTRAINT_SPEC_TYPES.get(constraint_type)
+        if spec_type is None:
+            logger.warning("Unknown constraint type: %s", constraint_type)
+            return False
+        return self._apply_constraint_spec(spec_type.from_dict(constraint_data))
+    
+    def _apply_constraint_specs(self, specs: List[Union[IKConstraintSpec, TrackConstraintSpec]]) -> bool:
+        if self.current_armature:
+            for spec in specs:
+                if not self._apply_constraint_spec(spec):
+                    return False
+        return True
+    
+    def _apply_constraint_spec(self, spec: Union[IKConstraintSpec, TrackConstraintSpec]) -> bool:
+        """Add one constraint to its pose bone; constraints can be added from any mode."""
+        pose_bone = self._get_pose_bone(spec.bone)
+        if not pose_bone:
+            logger.warning("Bone %s not found", spec.bone)
+            return False
+        
+        self._CONSTRAINT_HANDLERS[type(spec)](self, pose_bone, spec)
+        return True
+    
+    def _apply_ik_constraint(self, pose_bone, spec: IKConstraintSpec):
+        """Apply an IK constraint to a pose bone."""
+        # Create IK constraint
+        ik_constraint = pose_bone.constraints.new(type='IK')
+        ik_constraint.name = f"IK_{pose_bone.name}"
+        
+        # Set target if specified
+        if spec.target is not None:
+            target_obj = self._get_target(spec.target)
+            if target_obj:
+                ik_constraint.target = target_obj
+        
+        # 0 keeps Blender's default of the whole chain
+        ik_constraint.chain_count = spec.chain_length
+        
+        # Set other IK properties
+        ik_constraint.use_tail = True
+        ik_constraint.use_stretch = False
+    
+    def _apply_track_constraint(self, pose_bone, spec: TrackConstraintSpec):
+        """Apply a track-to constraint to a pose bone."""
+        # Create track-to constraint
+        track_constraint = pose_bone.constraints.new(type='TRACK_TO')
+        track_constraint.name = f"Track_{pose_bone.name}"
+        
+        # Set target if specified
+        if spec.target is not None:
+            target_obj = self._get_target(spec.target)
+            if target_obj:
+                track_constraint.target = target_obj
+        
+        # Set tracking axis
+        track_constraint.track_axis = 'TRACK_Y'
+        track_constraint.up_axis = 'UP_Z'
+    
+    # Constraint builder for each spec type
+    _CONSTRAINT_HANDLERS = {
+        IKConstraintSpec: _apply_ik_constraint,
+        TrackConstraintSpec: _apply_track_constraint
+    }
+    
+    def _create_target_empty(self, name: str, location: Tuple[float, float, float]):
+        bpy.ops.object.empty_add(type='PLAIN_AXES', location=location)
+        empty_obj = bpy.context.active_object
+        empty_obj.name = name
+        
+        self._add_scene_object(name, empty_obj)
+        self._target_cache[name] = empty_obj
+        logger.info("Created target empty: %s at %s", name, location)
+    
+    def _animate_to_target(self, target_name: str, target_position: Tuple[float, float, float],
+                           duration_frames: int) -> bool:
+        target_obj = self._get_target(target_name)
+        if not target_obj:
+            logger.warning("Target object %s not found", target_name)
+            return False
+        
+        # Key start and end positions straight into the location fcurves
+        current_frame = bpy.context.scene.frame_current
+        start_location = tuple(target_obj.location)
+        frames = np.array((current_frame, current_frame + duration_frames), dtype=np.float32)
+        action = self._get_action(target_obj)
+        for index in range(3):
+            values = np.array((start_location[index], target_position[index]), dtype=np.float32)
+            self._append_fcurve_points(action, "location", index, frames, values)
+        
+        logger.info("Animated %s to %s", target_name, target_position)
+        return True
+    
+    def _export_animation(self, filepath: str, format: str) -> bool:
+        # Limit FBX/glTF exports to the objects this manager created, so the
+        # exporters do not walk every unrelated object in the file
+        use_selection = format.upper() in ("FBX", "GLTF") and self._select_managed_objects()
+        
+        if format.upper() == "FBX":
+            bpy.ops.export_scene.fbx(filepath=filepath, use_selection=use_selection, **_FBX_EXPORT_KWARGS)
+        elif format.upper() == "GLTF":
+            bpy.ops.export_scene.gltf(filepath=filepath, use_selection=use_selection, **_GLTF_EXPORT_KWARGS)
+        elif format.upper() == "BLEND":
+            bpy.ops.wm.save_as_mainfile(filepath=filepath)
+        else:
+            logger.error("Unsupported export format: %s", format)
+            return False
+        
+        logger.info("Exported animation to %s", filepath)
+        return True
+    
+    def _select_managed_objects(self) -> bool:
+        """Select exactly the managed objects; return False if there are none."""
+        managed = [obj for obj in self._handles if obj is not None]
+        if not managed:
+            return False
+        
+        for obj in bpy.context.selected_objects:
+            obj.select_set(False)
+        for obj in managed:
+            obj.select_set(True)
+        return True
+    
+    def _clear_scene_data(self):
+        # Remove the current scene's objects plus only the data-blocks this manager
+        # created, in one data API call; no operators, and no sweep over every
+        # data-block in the file
+        scene = bpy.context.scene
+        removed = []
+        for obj in scene.objects:
+            if len(obj.users_scene) > 1:
+                # Also used by another scene: only take it out of this one
+                self._unlink_from_scene(obj, scene)
+            else:
+                removed.append(obj)
+        
+        for block in (*self._owned_data, *self._armature_template_cache.values()):
+            try:
+                block.name
+                removed.append(block)
+            except ReferenceError:
+                pass  # Already removed elsewhere
+        self._owned_data.clear()
+        self._armature_template_cache.clear()
+        bpy.data.batch_remove(removed)
+    
+    @staticmethod
+    def _unlink_from_scene(obj, scene):
+        """Unlink obj from every collection in scene's collection tree."""
+        collections = [scene.collection]
+        while collections:
+            collection = collections.pop()
+            if collection.objects.get(obj.name) == obj:
+                collection.objects.unlink(obj)
+            collections.extend(collection.children)
+    
+    def get_scene_info(self) -> Dict[str, Any]:
+        info = super().get_scene_info()
+        # The current frame and object count change without a scene update, so read them fresh
+        info["current_frame"] = bpy.context.scene.frame_current
+        info["total_objects"] = len(_objects())
+        return info
+    
+    def _build_scene_info(self) -> Dict[str, Any]:
+        info = super()._build_scene_info()
+        info.update({
+            "frame_start": bpy.context.scene.frame_start,
+            "frame_end": bpy.context.scene.frame_end
+        })
+        return info
+
+
+class _MockBlenderSceneManager(BlenderSceneManager):
+    """BlenderSceneManager for environments without Blender; records calls only."""
+    
+    def _setup_backend(self):
+        """Setup mock Blender objects for testing."""
+        class MockOps:
+            class object:
+                @staticmethod
+                def armature_add():
+                    pass
+                
+                @staticmethod
+                def mode_set(mode='OBJECT'):
+                    pass
+            
+            class anim:
+                @staticmethod
+                def keyframe_insert():
+                    pass
+                
+                @staticmethod
+                def keyframe_clear_v3d():
+                    pass
+            
+            class pose:
+                @staticmethod
+                def select_all(action='SELECT'):
+                    pass
         
-        if BLENDER_AVAILABLE:
-            info.update({
-                "current_frame": bpy.context.scene.frame_current,
-                "frame_start": bpy.context.scene.frame_start,
-                "frame_end": bpy.context.scene.frame_end,
-                "total_objects": len(bpy.data.objects)
-            })
+        class MockContext:
+            def __init__(self):
+                self.object = None
+                self.scene = MockScene()
         
-        return info 
\ No newline at end of file
+        class MockScene:
+            def __init__(self):
+                self.frame_current = 1
+            
+            def frame_set(self, frame):
+                self.frame_current = frame
+        
+        self.ops = MockOps()
+        self.context = MockContext()
+        self.data = {}
+    
+    def _create_armature(self, armature_name: str, joint_names: Optional[List[str]]):
+        self.ops.object.armature_add()
+        self.current_armature_name = armature_name
+        self._add_scene_object(armature_name, armature_name)
+    
+    def _insert_keyframe_items(self, items: List[Dict[str, Any]]) -> bool:
+        for keyframe_data in items:
+            self.ops.anim.keyframe_insert()
+        return True
+    
+    def _write_rotation_keyframes(self, bone_name: str, frames: np.ndarray, eulers: np.ndarray) -> bool:
+        self.context.scene.frame_set(int(frames[-1]))
+        self.ops.anim.keyframe_insert()
+        return True
+    
+    def _push_trajectory_strip(self, name: str, bone_name: str,
+                               frames: np.ndarray, eulers: np.ndarray) -> bool:
+        return True
+    
+    def _apply_constraint_data(self, constraint_type: str, constraint_data: Dict[str, Any]) -> bool:
+        return True
+    
+    def _apply_constraint_specs(self, specs: List[Union[IKConstraintSpec, TrackConstraintSpec]]) -> bool:
+        return True
+    
+    def _create_target_empty(self, name: str, location: Tuple[float, float, float]):
+        self._add_scene_object(name, {"location": location})
+    
+    def _animate_to_target(self, target_name: str, target_position: Tuple[float, float, float],
+                           duration_frames: int) -> bool:
+        return True
+    
+    def _export_animation(self, filepath: str, format: str) -> bool:
+        logger.info("Mock export to %s in %s format", filepath, format)
+        return True
+    
+    def _clear_scene_data(self):
+        pass
@@ -29,44 +29,176 @@ bl_info = {
     "support": "COMMUNITY"
 }
 
+import time
+from functools import lru_cache
+
 import bpy
 import bmesh
 from bpy.types import Panel, Operator, PropertyGroup
 from bpy.props import StringProperty, FloatProperty, EnumProperty, BoolProperty, CollectionProperty
 from typing import Dict, Any
 
-# Import our enhanced core modules with error handling
-try:
-    from ..core.engineering_brain import EngineeringBrain, RobotKinematicType
-    from ..process_animator import ProcessAnimator
-    from ..ui.smart_dashboard import SmartDashboard
-    from ..manufacturing.smart_scaler import SmartScaler
-    from ..manufacturing.robot_analyzer import RobotAnalyzer
-    from ..manufacturing.gcode_generator import GCodeGenerator
-except ImportError as e:
-    print(f"ProcessAnimator: Import error - {e}")
-    # Create dummy classes to prevent crashes during development
-    class EngineeringBrain: pass
-    class ProcessAnimator: pass
-    class SmartDashboard: pass
-    class SmartScaler: pass
-    class RobotAnalyzer: pass
-    class GCodeGenerator: pass
+# Core modules are heavy, so operators import what they need inside execute()
+# rather than when Blender loads the addon
 
 # Global addon state with enhanced capabilities
 addon_state = {
     'engineering_brain': None,
     'smart_dashboard': None,
+    'dashboard_registered': False,
     'process_animator': None,
     'smart_scaler': None,
     'robot_analyzer': None,
     'gcode_generator': None,
     'current_analysis': None,
+    '_resolved_gcode_path': None,
     'learning_enabled': True,
     'real_time_mode': True
 }
 
 
+# Robot enum items, built once at import. Blender re-queries dynamic enum
+# items on every draw, so the callback hands back this same tuple each time
+_ROBOT_ITEMS = (
+    ('AUTO', 'Auto-Detect', 'Automatically detect and recommend best robot'),
+
+    # Universal Robots Series
+    ('UR3e', 'Universal Robots UR3e', 'UR3e collaborative robot (3kg payload, 500mm reach)'),
+    ('UR5e', 'Universal Robots UR5e', 'UR5e collaborative robot (5kg payload, 850mm reach)'),
+    ('UR10e', 'Universal Robots UR10e', 'UR10e collaborative robot (10kg payload, 1300mm reach)'),
+    ('UR16e', 'Universal Robots UR16e', 'UR16e collaborative robot (16kg payload, 900mm reach)'),
+    ('UR20', 'Universal Robots UR20', 'UR20 collaborative robot (20kg payload, 1750mm reach)'),
+    ('UR30', 'Universal Robots UR30', 'UR30 collaborative robot (30kg payload, 1300mm reach)'),
+
+    # KUKA Robots
+    ('KR 3 R540', 'KUKA KR 3 R540', 'KUKA industrial robot (3kg payload, 541mm reach)'),
+    ('KR 6 R700', 'KUKA KR 6 R700', 'KUKA industrial robot (6kg payload, 706mm reach)'),
+    ('KR 10 R1100', 'KUKA KR 10 R1100', 'KUKA industrial robot (10kg payload, 1101mm reach)'),
+    ('KR 16 R1610', 'KUKA KR 16 R1610', 'KUKA industrial robot (16kg payload, 1611mm reach)'),
+    ('KR 50 R2500', 'KUKA KR 50 R2500', 'KUKA heavy-duty robot (50kg payload, 2500mm reach)'),
+    ('KR 120 R2500', 'KUKA KR 120 R2500', 'KUKA heavy-duty robot (120kg payload, 2500mm reach)'),
+
+    # ABB Robots
+    ('IRB 120', 'ABB IRB 120', 'ABB compact robot (3kg payload, 580mm reach)'),
+    ('IRB 1200', 'ABB IRB 1200', 'ABB versatile robot (7kg payload, 700mm reach)'),
+    ('IRB 2600', 'ABB IRB 2600', 'ABB industrial robot (20kg payload, 1650mm reach)'),
+    ('IRB 4600', 'ABB IRB 4600', 'ABB high-performance robot (60kg payload, 2050mm reach)'),
+    ('IRB 6700', 'ABB IRB 6700', 'ABB heavy-duty robot (150kg payload, 3200mm reach)'),
+    ('IRB 8700', 'ABB IRB 8700', 'ABB ultra-heavy robot (800kg payload, 4200mm reach)'),
+
+    # Specialized Robots
+    ('ABB FlexPicker IRB 360', 'ABB FlexPicker Delta', 'Delta robot for ultra-high speed pick & place'),
+    ('Epson LS6-B', 'Epson SCARA LS6-B', 'SCARA robot for precise assembly operations'),
+    ('Linear XYZ Gantry', 'Linear Gantry System', 'Linear 3-axis system for large workspace'),
+
+    # Educational/Simple Robots
+    ('Simple 2DOF Arm', 'Simple 2DOF Arm', 'Educational 2-axis robot arm'),
+
+    ('CUSTOM', 'Custom Robot', 'Define custom robot specifications'),
+)
+_ROBOT_BY_ID = {item[0]: item for item in _ROBOT_ITEMS}
+
+
+def _robot_items_callback(self, context):
+    """Items callback for ProcessAnimatorProperties.robot_type."""
+    return _ROBOT_ITEMS
+
+
+def _on_description_update(self, context):
+    """Abandon any dashboard analysis still running for the previous description."""
+    if not addon_state['dashboard_registered']:
+        return
+    dash = getattr(context.scene, 'smart_dashboard', None)
+    if dash is not None:
+        dash.cancel_pending_analysis()
+
+
+def _resolve_gcode_path(raw_path: str) -> str:
+    """Resolve a Blender-relative output path and cache it with its inputs."""
+    key = (raw_path, bpy.data.filepath)
+    cached = addon_state['_resolved_gcode_path']
+    if cached is None or cached[0] != key:
+        cached = (key, bpy.path.abspath(raw_path) + '.txt')
+        addon_state['_resolved_gcode_path'] = cached
+    return cached[1]
+
+
+def _on_gcode_path_update(self, context):
+    """Resolve the G-code output path as soon as it is edited."""
+    _resolve_gcode_path(self.gcode_output_path)
+
+
+# Main panel analysis box: formatted rows are rebuilt at most once per
+# debounce window so typing with live preview does not reformat every redraw
+_DRAW_DEBOUNCE_SECONDS = 0.033
+_last_draw_ts = 0.0
+_analysis_rows_cache = {'analysis': None, 'rows': ()}
+
+# (lower bound, emoji, icon) for the AI confidence row, highest bucket first
+_CONFIDENCE_BUCKETS = (
+    (0.8, '✅', 'CHECKMARK'),
+    (0.5, '⚠️', 'ERROR'),
+    (0.0, '❌', 'CANCEL'),
+)
+
+
+def _tag_view3d_redraw():
+    """Timer callback that redraws 3D views once a debounced update is due."""
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+    return None
+
+
+@lru_cache(maxsize=64)
+def _process_type_words(process_type: str) -> str:
+    """'pick_and_place' -> 'pick and place'."""
+    return process_type.replace('_', ' ')
+
+
+@lru_cache(maxsize=64)
+def _process_type_label(process_type: str) -> str:
+    """'pick_and_place' -> 'Pick And Place'."""
+    return _process_type_words(process_type).title()
+
+
+def _analysis_rows(analysis: Dict[str, Any]) -> tuple:
+    """Return the (text, icon) rows describing an analysis for the main panel."""
+    global _last_draw_ts
+    
+    if analysis is _analysis_rows_cache['analysis']:
+        return _analysis_rows_cache['rows']
+    
+    now = time.monotonic()
+    if now - _last_draw_ts < _DRAW_DEBOUNCE_SECONDS:
+        if not bpy.app.timers.is_registered(_tag_view3d_redraw):
+            bpy.app.timers.register(_tag_view3d_redraw, first_interval=_DRAW_DEBOUNCE_SECONDS)
+        return _analysis_rows_cache['rows']
+    _last_draw_ts = now
+    
+    rows = []
+    if analysis and analysis.get('success'):
+        confidence = analysis.get('confidence_score', 0)
+        emoji, icon = next(
+            ((emoji, icon) for bound, emoji, icon in _CONFIDENCE_BUCKETS if confidence > bound),
+            _CONFIDENCE_BUCKETS[-1][1:]
+        )
+        rows.append((f"{emoji} AI Confidence: {confidence:.1%}", icon))
+        
+        # Detected process and robot
+        if analysis.get('process_type'):
+            rows.append((f"🔧 Process: {_process_type_label(analysis['process_type'])}", 'NONE'))
+        
+        if analysis.get('recommended_robots'):
+            top_robot = analysis['recommended_robots'][0]
+            rows.append((f"🤖 Recommended: {top_robot['robot']}", 'NONE'))
+    
+    _analysis_rows_cache['analysis'] = analysis
+    _analysis_rows_cache['rows'] = tuple(rows)
+    return _analysis_rows_cache['rows']
+
+
 # Enhanced Property Groups
 class ProcessAnimatorProperties(PropertyGroup):
     """Enhanced properties for ProcessAnimator addon with comprehensive robot support."""
@@ -76,51 +208,16 @@ class ProcessAnimatorProperties(PropertyGroup):
         name="Process Description",
         description="Describe your manufacturing process in natural language - the AI will understand and visualize it",
         default="UR10 robot picks electronic components and assembles them in clean room",
-        maxlen=1024
+        maxlen=1024,
+        update=_on_description_update
     )
     
     # Comprehensive robot selection with all major types
     robot_type: EnumProperty(
         name="Robot Type",
         description="Select from comprehensive robot database",
-        items=[
-            ('AUTO', 'Auto-Detect', 'Automatically detect and recommend best robot'),
-            
-            # Universal Robots Series
-            ('UR3e', 'Universal Robots UR3e', 'UR3e collaborative robot (3kg payload, 500mm reach)'),
-            ('UR5e', 'Universal Robots UR5e', 'UR5e collaborative robot (5kg payload, 850mm reach)'),
-            ('UR10e', 'Universal Robots UR10e', 'UR10e collaborative robot (10kg payload, 1300mm reach)'),
-            ('UR16e', 'Universal Robots UR16e', 'UR16e collaborative robot (16kg payload, 900mm reach)'),
-            ('UR20', 'Universal Robots UR20', 'UR20 collaborative robot (20kg payload, 1750mm reach)'),
-            ('UR30', 'Universal Robots UR30', 'UR30 collaborative robot (30kg payload, 1300mm reach)'),
-            
-            # KUKA Robots
-            ('KR 3 R540', 'KUKA KR 3 R540', 'KUKA industrial robot (3kg payload, 541mm reach)'),
-            ('KR 6 R700', 'KUKA KR 6 R700', 'KUKA industrial robot (6kg payload, 706mm reach)'),
-            ('KR 10 R1100', 'KUKA KR 10 R1100', 'KUKA industrial robot (10kg payload, 1101mm reach)'),
-            ('KR 16 R1610', 'KUKA KR 16 R1610', 'KUKA industrial robot (16kg payload, 1611mm reach)'),
-            ('KR 50 R2500', 'KUKA KR 50 R2500', 'KUKA heavy-duty robot (50kg payload, 2500mm reach)'),
-            ('KR 120 R2500', 'KUKA KR 120 R2500', 'KUKA heavy-duty robot (120kg payload, 2500mm reach)'),
-            
-            # ABB Robots
-            ('IRB 120', 'ABB IRB 120', 'ABB compact robot (3kg payload, 580mm reach)'),
-            ('IRB 1200', 'ABB IRB 1200', 'ABB versatile robot (7kg payload, 700mm reach)'),
-            ('IRB 2600', 'ABB IRB 2600', 'ABB industrial robot (20kg payload, 1650mm reach)'),
-            ('IRB 4600', 'ABB IRB 4600', 'ABB high-performance robot (60kg payload, 2050mm reach)'),
-            ('IRB 6700', 'ABB IRB 6700', 'ABB heavy-duty robot (150kg payload, 3200mm reach)'),
-            ('IRB 8700', 'ABB IRB 8700', 'ABB ultra-heavy robot (800kg payload, 4200mm reach)'),
-            
-            # Specialized Robots
-            ('ABB FlexPicker IRB 360', 'ABB FlexPicker Delta', 'Delta robot for ultra-high speed pick & place'),
-            ('Epson LS6-B', 'Epson SCARA LS6-B', 'SCARA robot for precise assembly operations'),
-            ('Linear XYZ Gantry', 'Linear Gantry System', 'Linear 3-axis system for large workspace'),
-            
-            # Educational/Simple Robots
-            ('Simple 2DOF Arm', 'Simple 2DOF Arm', 'Educational 2-axis robot arm'),
-            
-            ('CUSTOM', 'Custom Robot', 'Define custom robot specifications')
-        ],
-        default='AUTO'
+        items=_robot_items_callback,
+        default=0
     )
     
     # Enhanced scaling with engineering intelligence
@@ -216,7 +313,8 @@ class ProcessAnimatorProperties(PropertyGroup):
         name="GCODE Output",
         description="Path to save generated robot program",
         default="//robot_program",
-        subtype='FILE_PATH'
+        subtype='FILE_PATH',
+        update=_on_gcode_path_update
     )
     
     # Process optimization
@@ -252,6 +350,8 @@ class PROCESSANIMATOR_PT_main_panel(Panel):
     def draw(self, context):
         layout = self.layout
         props = context.scene.process_animator_props
+        # The dashboard can only be attached to the scene once it is registered
+        dash = getattr(context.scene, 'smart_dashboard', None) if addon_state['dashboard_registered'] else None
         
         # Header with WOW factor
         row = layout.row()
@@ -260,11 +360,11 @@ class PROCESSANIMATOR_PT_main_panel(Panel):
         # Smart Dashboard activation
         layout.separator()
         row = layout.row(align=True)
-        if hasattr(context.scene, 'smart_dashboard') and context.scene.smart_dashboard.is_active:
+        if dash is not None and dash.is_active:
             row.operator("smart_dashboard.deactivate", text="📊 Dashboard ON", icon='PAUSE')
             row.prop(props, "enable_real_time_preview", text="Live")
         else:
-            row.operator("smart_dashboard.activate", text="📊 Activate Dashboard", icon='PLAY')
+            row.operator("process_animator.activate_dashboard", text="📊 Activate Dashboard", icon='PLAY')
         
         # Natural Language Input (the magic starts here)
         layout.separator()
@@ -272,28 +372,12 @@ class PROCESSANIMATOR_PT_main_panel(Panel):
         layout.prop(props, "process_description", text="")
         
         # Show AI confidence and analysis in real-time
-        if hasattr(context.scene, 'smart_dashboard') and context.scene.smart_dashboard.current_analysis:
-            analysis = context.scene.smart_dashboard.current_analysis
-            if analysis and analysis.get('success'):
-                confidence = analysis.get('confidence_score', 0)
-                
-                # Confidence indicator
+        if dash is not None and dash.current_analysis:
+            rows = _analysis_rows(dash.current_analysis)
+            if rows:
                 box = layout.box()
-                conf_row = box.row()
-                if confidence > 0.8:
-                    conf_row.label(text=f"✅ AI Confidence: {confidence:.1%}", icon='CHECKMARK')
-                elif confidence > 0.5:
-                    conf_row.label(text=f"⚠️ AI Confidence: {confidence:.1%}", icon='ERROR')
-                else:
-                    conf_row.label(text=f"❌ AI Confidence: {confidence:.1%}", icon='CANCEL')
-                
-                # Show detected process and robot
-                if analysis.get('process_type'):
-                    box.label(text=f"🔧 Process: {analysis['process_type'].replace('_', ' ').title()}")
-                
-                if analysis.get('recommended_robots'):
-                    top_robot = analysis['recommended_robots'][0]
-                    box.label(text=f"🤖 Recommended: {top_robot['robot']}")
+                for text, icon in rows:
+                    box.row().label(text=text, icon=icon)
         
         # Robot Selection with comprehensive database
         layout.separator()
@@ -377,6 +461,17 @@ class PROCESSANIMATOR_PT_advanced_panel(Panel):
         layout.prop(props, "optimization_target")
 
 
+# Generation time estimates per animation quality
+_QUALITY_TIMES = {
+    'WIREFRAME': "< 1 second",
+    'LOW': "5-10 seconds",
+    'MEDIUM': "30-60 seconds",
+    'HIGH': "2-5 minutes",
+    'ULTRA': "10-30 minutes",
+    'PRODUCTION': "30+ minutes"
+}
+
+
 # Animation Generation Panel (enhanced)
 class PROCESSANIMATOR_PT_animation_panel(Panel):
     """Enhanced animation generation with progressive quality."""
@@ -397,16 +492,7 @@ class PROCESSANIMATOR_PT_animation_panel(Panel):
         layout.prop(props, "animation_quality")
         
         # Time estimates based on quality
-        quality_times = {
-            'WIREFRAME': "< 1 second",
-            'LOW': "5-10 seconds",
-            'MEDIUM': "30-60 seconds", 
-            'HIGH': "2-5 minutes",
-            'ULTRA': "10-30 minutes",
-            'PRODUCTION': "30+ minutes"
-        }
-        
-        time_estimate = quality_times.get(props.animation_quality, "Unknown")
+        time_estimate = _QUALITY_TIMES.get(props.animation_quality, "Unknown")
         layout.label(text=f"⏱️ Est. time: {time_estimate}")
         
         # Generation buttons
@@ -464,11 +550,12 @@ class PROCESSANIMATOR_OT_analyze_and_recommend(Operator):
     def execute(self, context):
         props = context.scene.process_animator_props
         
-        # Initialize engineering brain if needed
-        if not addon_state['engineering_brain']:
-            addon_state['engineering_brain'] = EngineeringBrain()
-        
         try:
+            # Initialize engineering brain on first use
+            if not addon_state['engineering_brain']:
+                from ..core.engineering_brain import EngineeringBrain
+                addon_state['engineering_brain'] = EngineeringBrain()
+            
             # Analyze process description
             analysis = addon_state['engineering_brain'].analyze_process_description(
                 props.process_description
@@ -477,7 +564,8 @@ class PROCESSANIMATOR_OT_analyze_and_recommend(Operator):
             if analysis['success'] and analysis['recommended_robots']:
                 # Set the top recommended robot
                 top_robot = analysis['recommended_robots'][0]['robot']
-                props.robot_type = top_robot
+                if top_robot in _ROBOT_BY_ID:
+                    props.robot_type = top_robot
                 
                 addon_state['current_analysis'] = analysis
                 
@@ -508,11 +596,12 @@ class PROCESSANIMATOR_OT_smart_scale(Operator):
             self.report({'ERROR'}, "Please select a reference object")
             return {'CANCELLED'}
         
-        # Initialize smart scaler if needed
-        if not addon_state['smart_scaler']:
-            addon_state['smart_scaler'] = SmartScaler()
-        
         try:
+            # Initialize smart scaler if needed
+            if not addon_state['smart_scaler']:
+                from ..manufacturing.smart_scaler import SmartScaler
+                addon_state['smart_scaler'] = SmartScaler()
+            
             result = addon_state['smart_scaler'].scale_assembly(
                 reference_object=props.scale_reference_object,
                 real_dimension=props.scale_reference_dimension,
@@ -545,11 +634,12 @@ class PROCESSANIMATOR_OT_generate_animation(Operator):
     def execute(self, context):
         props = context.scene.process_animator_props
         
-        # Initialize process animator if needed
-        if not addon_state['process_animator']:
-            addon_state['process_animator'] = ProcessAnimator()
-        
         try:
+            # Initialize process animator if needed
+            if not addon_state['process_animator']:
+                from ..process_animator import ProcessAnimator
+                addon_state['process_animator'] = ProcessAnimator()
+            
             # Use engineering brain analysis if available
             if addon_state.get('current_analysis'):
                 enhanced_description = self._enhance_description_with_analysis(
@@ -580,20 +670,33 @@ class PROCESSANIMATOR_OT_generate_animation(Operator):
     
     def _enhance_description_with_analysis(self, description: str, analysis: Dict) -> str:
         """Enhance description with AI analysis results."""
-        enhancements = []
-        
-        if analysis.get('recommended_robots'):
-            robot = analysis['recommended_robots'][0]['robot']
-            enhancements.append(f"using {robot}")
+        robots = analysis.get('recommended_robots')
+        process_type = analysis.get('process_type')
         
-        if analysis.get('process_type'):
-            process = analysis['process_type'].replace('_', ' ')
-            enhancements.append(f"for {process}")
+        parts = []
+        if robots:
+            parts.append(f"using {robots[0]['robot']}")
+        if process_type:
+            process = analysis.get('process_type_text') or _process_type_words(process_type)
+            parts.append(f"for {process}")
         
-        if enhancements:
-            return f"{description} ({', '.join(enhancements)})"
+        return f"{description} ({', '.join(parts)})" if parts else description
+
+
+class PROCESSANIMATOR_OT_activate_dashboard(Operator):
+    """Activate the smart dashboard, registering it first if needed."""
+    bl_idname = "process_animator.activate_dashboard"
+    bl_label = "Activate Dashboard"
+    bl_description = "Activate real-time smart dashboard"
+    
+    def execute(self, context):
+        try:
+            _register_dashboard()
+        except Exception as e:
+            self.report({'ERROR'}, f"Dashboard unavailable: {str(e)}")
+            return {'CANCELLED'}
         
-        return description
+        return bpy.ops.smart_dashboard.activate()
 
 
 class PROCESSANIMATOR_OT_quick_preview(Operator):
@@ -640,10 +743,11 @@ class PROCESSANIMATOR_OT_generate_gcode(Operator):
     def execute(self, context):
         props = context.scene.process_animator_props
         
-        if not addon_state['gcode_generator']:
-            addon_state['gcode_generator'] = GCodeGenerator()
-        
         try:
+            if not addon_state['gcode_generator']:
+                from ..manufacturing.gcode_generator import GCodeGenerator
+                addon_state['gcode_generator'] = GCodeGenerator()
+            
             # Generate code based on current analysis and robot selection
             robot_type = props.robot_type
             if robot_type == 'AUTO' and addon_state.get('current_analysis'):
@@ -658,7 +762,7 @@ class PROCESSANIMATOR_OT_generate_gcode(Operator):
                 'robot_type': robot_type,
                 'code_lines': 25,
                 'language': 'URScript' if 'UR' in robot_type else 'RAPID',
-                'file_path': props.gcode_output_path + '.txt'
+                'file_path': _resolve_gcode_path(props.gcode_output_path)
             }
             
             # Create a simple robot program file
@@ -698,7 +802,7 @@ movej([0, -90, 90, 0, 90, 0], a=1.4, v=1.0)
 
 
 # Registration
-classes = [
+classes = (
     ProcessAnimatorProperties,
     PROCESSANIMATOR_PT_main_panel,
     PROCESSANIMATOR_PT_scaling_panel,
@@ -708,46 +812,72 @@ classes = [
     PROCESSANIMATOR_OT_analyze_and_recommend,
     PROCESSANIMATOR_OT_smart_scale,
     PROCESSANIMATOR_OT_generate_animation,
+    PROCESSANIMATOR_OT_activate_dashboard,
     PROCESSANIMATOR_OT_quick_preview,
     PROCESSANIMATOR_OT_select_reference,
     PROCESSANIMATOR_OT_generate_gcode,
-]
+)
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
 
 
-def register():
-    # Register UI classes
-    for cls in classes:
-        bpy.utils.register_class(cls)
+def _register_dashboard():
+    """Register the smart dashboard classes once."""
+    if addon_state['dashboard_registered']:
+        return
     
-    # Register smart dashboard
     from ..ui.smart_dashboard import register as register_dashboard
     register_dashboard()
+    addon_state['dashboard_registered'] = True
+
+
+def _deferred_dashboard_register():
+    """Timer callback that registers the dashboard after startup has finished."""
+    try:
+        _register_dashboard()
+    except Exception as e:
+        print(f"ProcessAnimator: Smart dashboard registration failed - {e}")
+    return None
+
+
+def register():
+    # Register UI classes
+    _register_classes()
+    
+    # Register smart dashboard on the next event loop tick so loading the
+    # dashboard modules does not hold up Blender's first redraw
+    bpy.app.timers.register(_deferred_dashboard_register, first_interval=0.0)
     
     # Add properties to scene
     bpy.types.Scene.process_animator_props = bpy.props.PointerProperty(type=ProcessAnimatorProperties)
     
-    # Initialize core systems
-    addon_state['engineering_brain'] = EngineeringBrain()
+    # The engineering brain is created by the first AI recommendation request
     
     print("🚀 ProcessAnimator 2.0 - Hyper-Intelligent Robot Animation System registered!")
     print("✅ Comprehensive robot database loaded")
-    print("🧠 Engineering brain activated")
-    print("📊 Smart dashboard ready")
+    print("🧠 Engineering brain loads on first use")
+    print("📊 Smart dashboard loads in the background")
     print("🎯 Ready for WOW-factor robot animation!")
 
 
 def unregister():
-    # Unregister smart dashboard
-    from ..ui.smart_dashboard import unregister as unregister_dashboard
-    unregister_dashboard()
+    # Unregister smart dashboard, or drop the pending registration
+    if bpy.app.timers.is_registered(_deferred_dashboard_register):
+        bpy.app.timers.unregister(_deferred_dashboard_register)
+    if addon_state['dashboard_registered']:
+        from ..ui.smart_dashboard import unregister as unregister_dashboard
+        unregister_dashboard()
+        addon_state['dashboard_registered'] = False
     
     # Unregister UI classes
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    _unregister_classes()
     
     # Remove properties
     del bpy.types.Scene.process_animator_props
     
+    # Remove the scene manager's bpy.app handlers
+    from ..blender.scene_manager import remove_handlers
+    remove_handlers()
+    
     # Save learning history before shutdown
     if addon_state.get('engineering_brain'):
         addon_state['engineering_brain'].save_learning_history()
@@ -5,7 +5,28 @@ Core module for ProcessAnimator
 Contains the engineering brain and core intelligence systems.
 """
 
-from .engineering_brain import EngineeringBrain, RobotKinematicType, RobotSpecification
+import importlib
+
+# engineering_brain pulls in bpy and numpy, so it is only imported when one of
+# its names is first used
+_LAZY_IMPORTS = {
+    'EngineeringBrain': '.engineering_brain',
+    'RobotKinematicType': '.engineering_brain',
+    'RobotSpecification': '.engineering_brain',
+}
+
+
+def __getattr__(name):
+    """Resolve the engineering brain exports on first attribute access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'EngineeringBrain',
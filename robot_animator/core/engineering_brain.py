@@ -363,6 +363,7 @@ class EngineeringBrain:
             'success': False,
             'robot_requirements': {},
             'process_type': None,
+            'process_type_text': None,
             'engineering_constraints': {},
             'optimization_opportunities': [],
             'safety_considerations': [],
@@ -377,6 +378,8 @@ class EngineeringBrain:
             # Identify process type
             process_type = self._identify_process_type(description_lower)
             analysis['process_type'] = process_type
+            if process_type:
+                analysis['process_type_text'] = process_type.replace('_', ' ')
             
             # Determine robot requirements
             robot_reqs = self._determine_robot_requirements(description_lower, process_type)
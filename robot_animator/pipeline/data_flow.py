@@ -393,9 +393,12 @@ class DataFlowPipeline:
             target_pos = motion_plan["target_position"]
             self.scene_manager.create_target_empty("target_empty", target_pos)
             
-            # Insert keyframes
+            # Insert keyframes, written per bone in one pass
             for keyframe in keyframes["keyframes"]:
-                self.scene_manager.insert_keyframe(keyframe)
+                self.scene_manager.enqueue_keyframe(
+                    keyframe["bone"], keyframe["frame"], keyframe["rotation"]
+                )
+            self.scene_manager.flush_keyframes()
             
             # Apply constraints
             for constraint in keyframes["constraints"]:
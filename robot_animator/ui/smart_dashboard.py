@@ -25,7 +25,6 @@ import time
 import threading
 
 from ..core.engineering_brain import EngineeringBrain, RobotKinematicType
-from ..process_animator import ProcessAnimator
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +38,9 @@ class SmartDashboard:
     """
     
     def __init__(self):
+        # process_animator imports this package, so bind it at call time
+        from ..process_animator import ProcessAnimator
+        
         self.engineering_brain = EngineeringBrain()
         self.process_animator = ProcessAnimator()
         self.is_active = False
@@ -53,6 +55,9 @@ class SmartDashboard:
         self.analysis_delay = 0.5  # seconds
         self.current_analysis = None
         
+        # Set to abandon the background analysis of an outdated description
+        self._analysis_cancel = threading.Event()
+        
         logger.info("Smart Dashboard initialized")
     
     def _initialize_ui_state(self) -> Dict[str, Any]:
@@ -118,22 +123,31 @@ class SmartDashboard:
             if description != self.ui_state['current_description']:
                 self.ui_state['current_description'] = description
                 
-                # Perform analysis in background thread
+                # Perform analysis in background thread; only the newest
+                # description's result is published
+                self.cancel_pending_analysis()
                 if description.strip():
                     threading.Thread(
                         target=self._background_analysis,
-                        args=(description,),
+                        args=(description, self._analysis_cancel),
                         daemon=True
                     ).start()
     
-    def _background_analysis(self, description: str):
+    def cancel_pending_analysis(self):
+        """Drop the result of any background analysis still running."""
+        self._analysis_cancel.set()
+        self._analysis_cancel = threading.Event()
+    
+    def _background_analysis(self, description: str, cancel: Optional[threading.Event] = None):
         """Perform engineering analysis in background thread."""
         try:
             analysis = self.engineering_brain.analyze_process_description(description)
+            if cancel is not None and cancel.is_set():
+                return
             
             # Update UI state (thread-safe)
             bpy.app.timers.register(
-                lambda: self._update_analysis_results(analysis),
+                lambda: None if cancel is not None and cancel.is_set() else self._update_analysis_results(analysis),
                 first_interval=0.01
             )
             
@@ -12,10 +12,52 @@ class MockBpy:
     class types:
         class Object:
             pass
+        class Panel:
+            pass
+        class Operator:
+            pass
+        class PropertyGroup:
+            pass
+        class WorkSpaceTool:
+            pass
+        class SpaceView3D:
+            pass
+    
+    class props:
+        @staticmethod
+        def _property(**kwargs):
+            return None
+        StringProperty = FloatProperty = IntProperty = _property
+        EnumProperty = BoolProperty = _property
+        CollectionProperty = PointerProperty = _property
     
     class context:
         scene = None
         object = None
+    
+    class app:
+        version = (3, 6, 0)
+        
+        class handlers:
+            load_post = []
+            depsgraph_update_post = []
+            
+            @staticmethod
+            def persistent(func):
+                return func
+        
+        class timers:
+            @staticmethod
+            def register(func, first_interval=0, persistent=False):
+                pass
+            
+            @staticmethod
+            def is_registered(func):
+                return False
+            
+            @staticmethod
+            def unregister(func):
+                pass
 
 # Mock mathutils module for testing
 class MockMathutils:
@@ -37,11 +79,27 @@ class MockBmesh:
 class MockGpu:
     pass
 
+# Mock gpu_extras module for testing
+class MockGpuExtras:
+    class batch:
+        @staticmethod
+        def batch_for_shader(*args, **kwargs):
+            pass
+
+# Mock blf module for testing
+class MockBlf:
+    pass
+
 # Add mock modules to sys.modules
 sys.modules['bpy'] = MockBpy()
+sys.modules['bpy.types'] = MockBpy.types
+sys.modules['bpy.props'] = MockBpy.props
 sys.modules['mathutils'] = MockMathutils()
 sys.modules['bmesh'] = MockBmesh()
 sys.modules['gpu'] = MockGpu()
+sys.modules['gpu_extras'] = MockGpuExtras()
+sys.modules['gpu_extras.batch'] = MockGpuExtras.batch
+sys.modules['blf'] = MockBlf()
 
 # Add the project root to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
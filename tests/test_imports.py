@@ -0,0 +1,19 @@
+import importlib
+import sys
+
+
+def test_package_imports_under_mock_bpy():
+    """The package imports against the conftest bpy mock."""
+    robot_animator = importlib.import_module('robot_animator')
+    
+    for name in robot_animator.__all__:
+        assert hasattr(robot_animator, name)
+
+
+def test_import_registers_no_handlers():
+    """Handlers are installed by the first scene manager, not at import time."""
+    importlib.import_module('robot_animator.blender.scene_manager')
+    
+    handlers = sys.modules['bpy'].app.handlers
+    assert handlers.load_post == []
+    assert handlers.depsgraph_update_post == []
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+from robot_animator.animation.iterative_animator import IterativeAnimator
+
+@pytest.fixture
+def animator():
+    return IterativeAnimator()
+
+def test_results_are_json_serializable(animator):
+    """Animator results hold plain containers only."""
+    started = animator.start_animation({'quality_level': 'low', 'animation_duration': 2.0})
+    assert started['success'] is True
+    
+    updated = animator.update_quality('high')
+    assert updated['success'] is True
+    
+    for result in (started, updated, animator.get_quality_comparison(),
+                   animator.get_animation_progress()):
+        json.dumps(result)
+
+def test_results_do_not_share_presets(animator):
+    """Mutating a returned result leaves later results unchanged."""
+    animator.start_animation({'quality_level': 'low'})
+    comparison = animator.get_quality_comparison()
+    comparison['low']['frame_rate'] = -1
+    
+    updated = animator.update_quality('medium')
+    updated['new_settings']['resolution']['width'] = -1
+    
+    assert animator.get_quality_comparison()['low']['frame_rate'] != -1
+    assert animator.quality_presets['medium']['resolution']['width'] != -1
+
+def test_update_quality_to_same_level(animator):
+    """Re-selecting the current quality keeps and reports the running render."""
+    started = animator.start_animation({'quality_level': 'medium'})
+    
+    result = animator.update_quality('medium')
+    
+    assert result['success'] is True
+    assert result['old_quality'] == result['new_quality'] == 'medium'
+    assert result['quality_improved'] is False
+    assert isinstance(result['render_result'], dict)
+    assert result['render_result'] == started['render_result']
+    json.dumps(result)
+
+def test_raster_previews_stay_within_budget(animator):
+    """Raster previews are counted at their frame size and evicted past the budget."""
+    first = animator.start_animation({'quality_level': 'low', 'animation_duration': 2.0})
+    assert first['render_result']['preview_cache_tier'] == 'raster'
+    assert animator._raster_cache_bytes > 0
+    
+    # A second ~30 MB preview pushes the tier past its 50 MB budget
+    animator.start_animation({'quality_level': 'low', 'animation_duration': 2.0,
+                              'robot_type': 'KUKA KR'})
+    assert 0 < animator._raster_cache_bytes <= 50 * 1024 * 1024
+    assert len(animator._preview_cache) == 1
@@ -0,0 +1,164 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from robot_animator.blender import scene_manager
+
+
+class FakeObjects(dict):
+    """Name-keyed stand-in for a bpy collection's objects."""
+    
+    def unlink(self, obj):
+        del self[obj.name]
+
+
+class FakeCollection:
+    def __init__(self, *objects, children=()):
+        self.objects = FakeObjects((obj.name, obj) for obj in objects)
+        self.children = list(children)
+
+
+class FakeObject:
+    def __init__(self, name):
+        self.name = name
+        self.users_scene = []
+
+
+class FakeKeyframePoints:
+    """keyframe_points stand-in holding (frame, value, interpolation) rows."""
+    
+    def __init__(self):
+        self.rows = []
+    
+    def __len__(self):
+        return len(self.rows)
+    
+    def add(self, count):
+        self.rows.extend([0.0, 0.0, 0] for _ in range(count))
+    
+    def foreach_get(self, attr, buffer):
+        if attr == 'co':
+            buffer[0::2] = [row[0] for row in self.rows]
+            buffer[1::2] = [row[1] for row in self.rows]
+        else:
+            buffer[:] = [row[2] for row in self.rows]
+    
+    def foreach_set(self, attr, buffer):
+        assert len(buffer) == (2 if attr == 'co' else 1) * len(self.rows)
+        for i, row in enumerate(self.rows):
+            if attr == 'co':
+                row[0], row[1] = float(buffer[2 * i]), float(buffer[2 * i + 1])
+            else:
+                row[2] = int(buffer[i])
+    
+    def keys(self):
+        return [(row[0], row[1]) for row in self.rows]
+
+
+class FakeFCurves:
+    def __init__(self):
+        self.curves = {}
+    
+    def find(self, data_path, index=0):
+        return self.curves.get((data_path, index))
+    
+    def new(self, data_path, index=0, action_group=None):
+        fcurve = SimpleNamespace(keyframe_points=FakeKeyframePoints(), update=lambda: None)
+        self.curves[(data_path, index)] = fcurve
+        return fcurve
+
+
+def link(obj, scene, collection):
+    collection.objects[obj.name] = obj
+    obj.users_scene.append(scene)
+
+
+@pytest.fixture
+def fake_bpy(monkeypatch):
+    """Two scenes: 'Main' is current, 'Other' is not."""
+    main = SimpleNamespace(name='Main', collection=FakeCollection(), frame_current=1,
+                           frame_start=1, frame_end=250)
+    main.objects = []
+    other = SimpleNamespace(name='Other', collection=FakeCollection())
+    other.objects = []
+    
+    removed = []
+    bpy = SimpleNamespace(
+        context=SimpleNamespace(scene=main),
+        data=SimpleNamespace(objects=[], batch_remove=removed.extend),
+        ops=SimpleNamespace(),
+        app=SimpleNamespace(handlers=SimpleNamespace(
+            load_post=[], depsgraph_update_post=[], persistent=lambda func: func)),
+        removed=removed,
+        main=main,
+        other=other,
+    )
+    monkeypatch.setattr(scene_manager, 'bpy', bpy, raising=False)
+    monkeypatch.setattr(scene_manager, 'BLENDER_AVAILABLE', True)
+    monkeypatch.setattr(scene_manager, '_data_objects', None)
+    return bpy
+
+
+def add_object(bpy, name, *scenes):
+    obj = FakeObject(name)
+    for scene in scenes:
+        child = scene.collection.children[0] if scene.collection.children else scene.collection
+        link(obj, scene, child)
+        scene.objects.append(obj)
+    return obj
+
+
+def test_clear_scene_keeps_other_scenes(fake_bpy):
+    """clear_scene removes only the current scene's objects."""
+    fake_bpy.main.collection.children.append(FakeCollection())
+    own = add_object(fake_bpy, 'Robot', fake_bpy.main)
+    shared = add_object(fake_bpy, 'Table', fake_bpy.main, fake_bpy.other)
+    elsewhere = add_object(fake_bpy, 'Camera', fake_bpy.other)
+    
+    manager = scene_manager.BlenderSceneManager()
+    assert manager.clear_scene() is True
+    
+    assert fake_bpy.removed == [own]
+    assert shared not in fake_bpy.removed and elsewhere not in fake_bpy.removed
+    
+    # The shared object is unlinked from the current scene's collection tree only
+    assert 'Table' not in fake_bpy.main.collection.children[0].objects
+    assert fake_bpy.other.collection.objects['Table'] is shared
+    assert fake_bpy.other.collection.objects['Camera'] is elsewhere
+
+
+def append_points(manager, action, frames, values):
+    manager._append_fcurve_points(action, 'location', 0,
+                                  np.array(frames, dtype=np.float32),
+                                  np.array(values, dtype=np.float32))
+    return sorted(action.fcurves.find('location', 0).keyframe_points.keys())
+
+
+def test_append_fcurve_points(fake_bpy):
+    """Bulk fcurve writes append new frames and overwrite existing ones in place."""
+    manager = scene_manager.BlenderSceneManager()
+    action = SimpleNamespace(fcurves=FakeFCurves())
+    
+    # Empty fcurve
+    assert append_points(manager, action, [1, 5, 3], [1.0, 5.0, 3.0]) == \
+        [(1.0, 1.0), (3.0, 3.0), (5.0, 5.0)]
+    
+    # Existing keys: frame 3 is overwritten, frames 2 and 7 are added
+    assert append_points(manager, action, [7, 3, 2], [7.0, 30.0, 2.0]) == \
+        [(1.0, 1.0), (2.0, 2.0), (3.0, 30.0), (5.0, 5.0), (7.0, 7.0)]
+    
+    points = action.fcurves.find('location', 0).keyframe_points
+    assert all(row[2] == scene_manager._BEZIER_INTERPOLATION for row in points.rows)
+
+
+def test_append_fcurve_points_duplicate_frames(fake_bpy):
+    """A frame repeated within one batch keeps only its last sample."""
+    manager = scene_manager.BlenderSceneManager()
+    action = SimpleNamespace(fcurves=FakeFCurves())
+    
+    assert append_points(manager, action, [4, 2, 4, 4], [1.0, 2.0, 3.0, 4.0]) == \
+        [(2.0, 2.0), (4.0, 4.0)]
+    
+    # Duplicates of an existing frame overwrite it once, with the last value
+    assert append_points(manager, action, [2, 6, 2], [20.0, 6.0, 21.0]) == \
+        [(2.0, 21.0), (4.0, 4.0), (6.0, 6.0)]